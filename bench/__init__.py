@@ -0,0 +1 @@
+"""Offline benchmarks for the job bot: fixture payloads, a local stand-in server and the runner."""
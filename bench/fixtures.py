@@ -0,0 +1,149 @@
+"""Feed payloads shaped like the real Remotive, RemoteOK, WWR and Hacker News responses.
+
+The field layout follows responses captured from each API; the contents are
+generated from a fixed seed and dated relative to REFERENCE_TIME, never the
+wall clock, so every run benchmarks identical bytes. Scale 1 is roughly what
+the boards serve today, scale 10 is the growth case.
+"""
+import json
+import random
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+# "Now" for every generated date; run_bench pins main.py's today() to the same day
+REFERENCE_TIME = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+# Jobs per source at scale 1
+BASE_COUNTS = {"remotive": 1000, "remoteok": 100, "wwr": 100, "hackernews": 200}
+
+TITLES = [
+    "Senior Python Engineer", "Backend Engineer", "Software Engineer, Platform",
+    "FastAPI Developer", "Staff Backend Engineer", "Frontend Engineer (React)",
+    "Data Engineer", "DevOps Engineer", "Product Designer", "Customer Success Manager",
+    "Machine Learning Engineer", "Senior Go Developer", "Full Stack Developer",
+    "Technical Writer", "Site Reliability Engineer", "Marketing Manager",
+]
+COMPANIES = [f"{a}{b}" for a in ("Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Tyrell")
+             for b in ("", " Labs", " Inc", " Cloud")]
+PARAGRAPH = (
+    "<p>We are looking for someone to join our distributed team and help us build reliable "
+    "services. You will work closely with product and design, own features end to end, and "
+    "take part in code review, on-call and planning. We value clear writing and kindness.</p>"
+)
+SKILLS = ["python", "django", "fastapi", "postgres", "kubernetes", "react", "typescript", "go", "aws", "terraform"]
+
+
+def _jobs(count, seed, now):
+    """Source-neutral job facts; about a tenth repeat an earlier title/company to feed dedup"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        if jobs and rng.random() < 0.1:
+            base = rng.choice(jobs)
+            title, company = base["title"], base["company"]
+        else:
+            title, company = rng.choice(TITLES), rng.choice(COMPANIES)
+        skills = rng.sample(SKILLS, 3)
+        description = "".join([PARAGRAPH] * rng.randint(4, 12)) + f"<ul>{''.join(f'<li>{s}</li>' for s in skills)}</ul>"
+        jobs.append({
+            "id": 100000 + i,
+            "title": title,
+            "company": company,
+            "description": description,
+            # Half inside the bot's 3-day window, half older
+            "posted": now - timedelta(hours=rng.randint(0, 72) if rng.random() < 0.5 else rng.randint(96, 720)),
+            "tags": skills,
+        })
+    return jobs
+
+
+def remotive_payload(scale=1, seed=1, now=REFERENCE_TIME):
+    jobs = _jobs(BASE_COUNTS["remotive"] * scale, seed, now)
+    return json.dumps({
+        "0-legal-notice": "Remotive API Legal Notice",
+        "job-count": len(jobs),
+        "total-job-count": len(jobs),
+        "jobs": [{
+            "id": j["id"],
+            "url": f"https://remotive.com/remote-jobs/software-dev/{j['id']}?utm_source=api",
+            "title": j["title"],
+            "company_name": j["company"],
+            "company_logo": f"https://remotive.com/job/{j['id']}/logo",
+            "category": "Software Development",
+            "tags": j["tags"],
+            "job_type": "full_time",
+            "publication_date": j["posted"].strftime("%Y-%m-%dT%H:%M:%S"),
+            "candidate_required_location": "Worldwide",
+            "salary": "",
+            "description": j["description"],
+        } for j in jobs],
+    }).encode("utf-8")
+
+
+def remoteok_payload(scale=1, seed=2, now=REFERENCE_TIME):
+    jobs = _jobs(BASE_COUNTS["remoteok"] * scale, seed, now)
+    return json.dumps([{"last_updated": int(now.timestamp()), "legal": "API Terms of Service"}] + [{
+        "slug": f"remote-{j['id']}",
+        "id": str(j["id"]),
+        "epoch": int(j["posted"].timestamp()),
+        "date": j["posted"].isoformat(),
+        "company": j["company"],
+        "position": j["title"],
+        "tags": j["tags"],
+        "description": j["description"],
+        "location": "Worldwide",
+        "url": f"https://remoteOK.com/remote-jobs/remote-{j['id']}",
+    } for j in jobs]).encode("utf-8")
+
+
+def wwr_payload(scale=1, seed=3, now=REFERENCE_TIME):
+    jobs = _jobs(BASE_COUNTS["wwr"] * scale, seed, now)
+    items = "".join(
+        "<item>"
+        f"<title>{j['company']}: {j['title']}</title>"
+        f"<region>Anywhere in the World</region>"
+        f"<pubDate>{format_datetime(j['posted'])}</pubDate>"
+        f"<description><![CDATA[{j['description']}]]></description>"
+        f"<link>https://weworkremotely.com/remote-jobs/{j['id']}</link>"
+        "</item>"
+        for j in jobs
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        "<title>We Work Remotely: Remote jobs</title>"
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def hackernews_payloads(scale=1, seed=4, now=REFERENCE_TIME):
+    """(jobstories.json body, {item id: item body})"""
+    jobs = _jobs(BASE_COUNTS["hackernews"] * scale, seed, now)
+    items = {}
+    for j in jobs:
+        item = {
+            "by": "hiring",
+            "id": j["id"],
+            "score": 1,
+            "time": int(j["posted"].timestamp()),
+            "title": f"{j['company']} (YC) is hiring a {j['title']}",
+            "type": "job",
+        }
+        if j["id"] % 2:
+            item["url"] = f"https://{j['company'].split()[0].lower()}.example/jobs/{j['id']}"
+        else:
+            item["text"] = j["description"]
+        items[j["id"]] = json.dumps(item).encode("utf-8")
+    return json.dumps(list(items)).encode("utf-8"), items
+
+
+def build(scale=1, now=REFERENCE_TIME):
+    """Every payload for one scale, keyed by the URL path the real API serves it at"""
+    stories, items = hackernews_payloads(scale, now=now)
+    routes = {
+        "/api/remote-jobs": remotive_payload(scale, now=now),
+        "/api": remoteok_payload(scale, now=now),
+        "/remote-jobs.rss": wwr_payload(scale, now=now),
+        "/v0/jobstories.json": stories,
+    }
+    routes.update({f"/v0/item/{jid}.json": body for jid, body in items.items()})
+    return routes
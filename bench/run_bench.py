@@ -0,0 +1,264 @@
+"""Benchmark each stage of the bot offline.
+
+Usage (from the repo root):
+
+    python -m bench.run_bench                      # scales 1 and 10
+    python -m bench.run_bench --scales 1 --latency 0.05 --error-rate 0.1
+    python -m bench.run_bench --json bench_output.json
+
+Every HTTP call from main.py is redirected to a local stand-in server, so
+nothing touches the network or the real Telegram chat. Each stage is timed
+once and then re-run under tracemalloc for its peak memory (skip that with
+--no-memory).
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import date
+from functools import partial
+
+# main.py reads its settings at import time, so point its state at a scratch
+# directory and give it dummy Telegram credentials before importing it
+WORK_DIR = tempfile.mkdtemp(prefix="jobbot-bench-")
+os.environ.update({
+    "TELEGRAM_TOKEN": "bench-token",
+    "CHAT_ID": "bench-chat",
+    "SEEN_DB_PATH": os.path.join(WORK_DIR, "seen_jobs.db"),
+    "HTTP_CACHE_DIR": os.path.join(WORK_DIR, "http_cache"),
+})
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+
+from bench import fixtures
+from bench.server import StandInServer, redirect
+
+
+class FixtureDate(date):
+    """date whose today() is the fixtures' reference day, so recency checks see the same split every run"""
+
+    @classmethod
+    def today(cls):
+        return fixtures.REFERENCE_TIME.date()
+
+
+main.date = FixtureDate
+
+
+def measure(fn, memory=True):
+    """(seconds, peak bytes or None, result) for one call of `fn`, with its output silenced"""
+    gc.collect()
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        peak = None
+        if memory:
+            gc.collect()
+            tracemalloc.start()
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def chunks(payload, size=main.STREAM_CHUNK_SIZE):
+    return (payload[i:i + size] for i in range(0, len(payload), size))
+
+
+def fresh_cache():
+    shutil.rmtree(main.HTTP_CACHE_DIR, ignore_errors=True)
+
+
+def raw_date_fields(routes):
+    """Every fixture's date field exactly as its feed carries it, shaped for is_recent_job().
+
+    That covers Remotive's ISO timestamps, RemoteOK's epoch ints and ISO dates,
+    WWR's RFC 822 pubDates and HN's epoch ints, grouped by feed like a real run.
+    """
+    remotive = json.loads(routes["/api/remote-jobs"])["jobs"]
+    remoteok = json.loads(routes["/api"])[1:]  # first element is metadata
+    wwr = ET.fromstring(routes["/remote-jobs.rss"]).iter("item")
+    hn = [json.loads(body) for path, body in routes.items() if path.startswith("/v0/item/")]
+    return (
+        [{"publication_date": job["publication_date"]} for job in remotive]
+        + [{"publication_date": job["epoch"]} for job in remoteok]
+        + [{"date": job["date"]} for job in remoteok]
+        + [{"publication_date": item.findtext("pubDate")} for item in wwr]
+        + [{"publication_date": item["time"]} for item in hn]
+    )
+
+
+def bench_scale(scale, args):
+    routes = fixtures.build(scale)
+    feed_bytes = sum(len(body) for body in routes.values())
+    results = []
+
+    def record(stage, items, elapsed, peak, nbytes=None):
+        results.append({
+            "scale": scale,
+            "stage": stage,
+            "items": items,
+            "seconds": round(elapsed, 4),
+            "items_per_sec": round(items / elapsed, 1) if elapsed else None,
+            "mb": round(nbytes / 1e6, 2) if nbytes else None,
+            "mb_per_sec": round(nbytes / 1e6 / elapsed, 2) if nbytes and elapsed else None,
+            "peak_mb": round(peak / 1e6, 2) if peak is not None else None,
+        })
+
+    server = StandInServer(
+        routes,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        telegram_429_every=args.telegram_429_every,
+    )
+    with server:
+        redirect(main.SESSION, server.base_url, pool_size=max(10, main.HN_CONCURRENCY))
+        def new_dispatcher():
+            return main.TelegramDispatcher(
+                session=redirect(main.make_session(pool_size=2), server.base_url),
+                rate=args.telegram_rate,
+                burst=args.telegram_burst,
+                per_minute=args.telegram_per_minute,
+            )
+        main.DISPATCHER = new_dispatcher()
+        # Scan every HN item the fixture has, not just the production top N
+        main.HN_MAX_ITEMS = fixtures.BASE_COUNTS["hackernews"] * scale
+
+        # fetch: download + stream-parse + filter for every source, cold cache
+        def fetch_cold():
+            fresh_cache()
+            server.reset_counters()
+            return main.fetch_all()
+        elapsed, peak, jobs = measure(fetch_cold, args.memory)
+        record("fetch (cold cache)", len(jobs), elapsed, peak, feed_bytes)
+
+        # fetch again: feeds answer 304 and are replayed from the on-disk cache
+        def fetch_revalidated():
+            server.reset_counters()
+            return main.fetch_all()
+        elapsed, peak, jobs = measure(fetch_revalidated, args.memory)
+        record("fetch (revalidated)", len(jobs), elapsed, peak, server.bytes_sent)
+
+        # The same two passes over just the cached feeds, without Hacker News's
+        # per-item requests: an unchanged feed skips the parse altogether
+        feeds = [(name, partial(main.fetch_source, name))
+                 for name, plugin in main.SOURCE_REGISTRY.items() if plugin.cached_feed]
+        feed_bytes_only = sum(len(routes[p]) for p in ("/api/remote-jobs", "/api", "/remote-jobs.rss"))
+
+        def feeds_cold():
+            fresh_cache()
+            return main.fetch_all(feeds)
+        elapsed, peak, jobs = measure(feeds_cold, args.memory)
+        record("feeds (cold cache)", len(jobs), elapsed, peak, feed_bytes_only)
+        elapsed, peak, jobs = measure(lambda: main.fetch_all(feeds), args.memory)
+        record("feeds (unchanged)", len(jobs), elapsed, peak)
+
+        # parse: the streaming parsers alone, straight from memory
+        def parse():
+            count = sum(1 for _ in main.iter_json_array(chunks(routes["/api/remote-jobs"]), key="jobs"))
+            count += sum(1 for _ in main.iter_json_array(chunks(routes["/api"])))
+            count += sum(1 for _ in main.iter_xml_items(chunks(routes["/remote-jobs.rss"])))
+            return count
+        elapsed, peak, count = measure(parse, args.memory)
+        record("parse", count, elapsed, peak, feed_bytes_only)
+
+        # Normalized (Job, text) pairs from every source, unfiltered, for the next stages
+        with contextlib.redirect_stdout(io.StringIO()):
+            pairs = [
+                pair
+                for plugin in main.SOURCE_REGISTRY.values()
+                for pair in plugin.iter_jobs(plugin.date_parser.parse)
+            ]
+
+        def keyword_filter():
+            return [job for job, text in pairs if main.is_recent_date(job.posted) and main.MATCHER.matches(text)]
+        elapsed, peak, matched = measure(keyword_filter, args.memory)
+        record("filter", len(pairs), elapsed, peak, sum(len(text) for _, text in pairs))
+
+        raw_dates = raw_date_fields(routes)
+        elapsed, peak, _ = measure(lambda: [main.is_recent_job(d) for d in raw_dates], args.memory)
+        record("is_recent_job", len(raw_dates), elapsed, peak)
+
+        all_jobs = [job for job, _ in pairs]
+        elapsed, peak, unique = measure(lambda: main.dedup_jobs(all_jobs), args.memory)
+        record("dedup", len(all_jobs), elapsed, peak)
+
+        # A fresh dispatcher per pass, so the memory pass starts with full rate
+        # buckets and a clean message count just like the timed one
+        to_send = main.dedup_jobs(matched)
+
+        def send():
+            server.reset_counters()
+            return new_dispatcher().send_jobs(to_send, digest=main.TELEGRAM_DIGEST)
+        elapsed, peak, sent = measure(send, args.memory)
+        record("send", len(sent), elapsed, peak)
+
+        # run(): the whole pipeline as the scheduled job runs it, from a clean state
+        def run_once():
+            fresh_cache()
+            if os.path.exists(main.SEEN_DB_PATH):
+                os.remove(main.SEEN_DB_PATH)
+            server.reset_counters()
+            main.run()
+        elapsed, peak, _ = measure(run_once, args.memory)
+        record("run() end-to-end", len(server.messages), elapsed, peak, feed_bytes)
+
+    return results
+
+
+def print_table(results):
+    header = f"{'scale':>5}  {'stage':<22}{'items':>8}{'seconds':>10}{'items/s':>12}{'MB':>8}{'MB/s':>9}{'peak MB':>9}"
+    print(header)
+    print("-" * len(header))
+
+    def fmt(value, width, spec):
+        return format("-" if value is None else format(value, spec), f">{width}")
+
+    for r in results:
+        print(
+            f"{r['scale']:>5}  {r['stage']:<22}{r['items']:>8}{r['seconds']:>10.3f}"
+            f"{fmt(r['items_per_sec'], 12, '.0f')}{fmt(r['mb'], 8, '.2f')}"
+            f"{fmt(r['mb_per_sec'], 9, '.2f')}{fmt(r['peak_mb'], 9, '.2f')}"
+        )
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark fetch, parse, filter, dedup and send offline")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="fixture sizes (1 = today's feeds)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every stand-in response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of feed requests that return 500")
+    parser.add_argument("--telegram-429-every", type=int, default=0, help="answer every Nth sendMessage with 429")
+    parser.add_argument("--telegram-rate", type=float, default=main.TELEGRAM_RATE, help="dispatcher messages/second")
+    parser.add_argument("--telegram-burst", type=int, default=main.TELEGRAM_BURST)
+    parser.add_argument("--telegram-per-minute", type=int, default=main.TELEGRAM_PER_MINUTE,
+                        help="dispatcher messages/minute cap, as for group chats (0 = none)")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc pass")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        results = []
+        for scale in args.scales:
+            results.extend(bench_scale(scale, args))
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+    print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,153 @@
+"""Local stand-in for the job boards and the Telegram Bot API.
+
+StandInServer serves fixture payloads at the same paths as the real APIs,
+with optional latency and error injection, and answers Telegram's
+sendMessage like the real endpoint (including 429s on demand). redirect()
+mounts an adapter on a requests session so calls to the real hosts land
+here instead, without changing any URLs in main.py.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit
+
+from requests.adapters import HTTPAdapter
+
+# Hosts main.py talks to; all of them are redirected to the stand-in
+REAL_HOSTS = [
+    "https://remotive.com",
+    "https://remoteok.io",
+    "https://weworkremotely.com",
+    "https://hacker-news.firebaseio.com",
+    "https://api.telegram.org",
+]
+
+
+class StandInServer:
+    """Threaded HTTP server for `routes` ({path: body bytes}) plus a fake Telegram API.
+
+    latency: seconds added to every response
+    error_rate: fraction of feed requests answered with 500
+    telegram_429_every: answer every Nth sendMessage with 429 (0 = never)
+    """
+
+    def __init__(self, routes, latency=0.0, error_rate=0.0, telegram_429_every=0, seed=0):
+        self.routes = routes
+        self.etags = {path: f'"{hashlib.sha1(body).hexdigest()[:16]}"' for path, body in routes.items()}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.telegram_429_every = telegram_429_every
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.messages = []
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="stand-in", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_counters(self):
+        with self.lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.messages = []
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body=b"", headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server.lock:
+                    server.requests += 1
+                    server.bytes_sent += len(body)
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                path = urlsplit(self.path).path
+                body = server.routes.get(path)
+                if body is None:
+                    return self._reply(404, b"{}")
+                with server.lock:
+                    failed = server.random.random() < server.error_rate
+                if failed:
+                    return self._reply(500, b"injected error")
+                etag = server.etags[path]
+                if self.headers.get("If-None-Match") == etag:
+                    return self._reply(304, headers={"ETag": etag})
+                content_type = "application/rss+xml" if path.endswith(".rss") else "application/json"
+                self._reply(200, body, {"Content-Type": content_type, "ETag": etag})
+
+            def do_POST(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                if not self.path.endswith("/sendMessage"):
+                    return self._reply(404, b"{}")
+                with server.lock:
+                    server.messages.append(length)
+                    count = len(server.messages)
+                every = server.telegram_429_every
+                if every and count % every == 0:
+                    body = {"ok": False, "error_code": 429, "description": "Too Many Requests: retry after 1",
+                            "parameters": {"retry_after": 1}}
+                    return self._reply(429, json.dumps(body).encode(), {"Content-Type": "application/json"})
+                body = {"ok": True, "result": {"message_id": count}}
+                self._reply(200, json.dumps(body).encode(), {"Content-Type": "application/json"})
+
+        return Handler
+
+
+class RedirectAdapter(HTTPAdapter):
+    """Sends every request to `base_url`, keeping the original path and query"""
+
+    def __init__(self, base_url, **kwargs):
+        self.netloc = urlsplit(base_url).netloc
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = urlunsplit(("http", self.netloc, parts.path, parts.query, ""))
+        return super().send(request, **kwargs)
+
+
+def redirect(session, base_url, pool_size=10):
+    """Point `session` at the stand-in for every host in REAL_HOSTS"""
+    adapter = RedirectAdapter(base_url, pool_connections=pool_size, pool_maxsize=pool_size)
+    for host in REAL_HOSTS:
+        session.mount(host, adapter)
+    return session
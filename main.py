@@ -1,9 +1,32 @@
+import argparse
+import cProfile
 import os
+import pstats
 import requests
 import re
+import codecs
+import hashlib
+import html
+import json
+import queue
+import random
+import signal
+import sqlite3
+import threading
 import time
+import zlib
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, date
+from email.utils import parsedate_to_datetime
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 # Load environment variables from .env file for local development
 load_dotenv()
@@ -17,233 +40,1393 @@ print(f"📝 TELEGRAM_TOKEN exists: {bool(TELEGRAM_TOKEN)}")
 print(f"📝 CHAT_ID exists: {bool(CHAT_ID)}")
 
 KEYWORDS = ["python", "fastapi", "backend", "software engineer", "backend engineer"]
+# Optional tuning: per-keyword weights (default 1), terms that reject a job outright,
+# and the total weight a job needs to count as a match
+KEYWORD_WEIGHTS = {}
+EXCLUDE_KEYWORDS = [k.strip() for k in os.getenv("EXCLUDE_KEYWORDS", "").split(",") if k.strip()]
+MIN_KEYWORD_SCORE = float(os.getenv("MIN_KEYWORD_SCORE", "1"))
+RECENT_DAYS = 3
 
-def send_telegram(message: str):
-    if not TELEGRAM_TOKEN or not CHAT_ID:
-        print("❌ Missing Telegram credentials")
-        return False
-        
-    url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
-    payload = {"chat_id": CHAT_ID, "text": message, "parse_mode": "HTML"}
+# Comma-separated source names to run (e.g. "Remotive,Hacker News"); empty runs
+# every source registered as enabled
+ENABLED_SOURCES = [s.strip() for s in os.getenv("ENABLED_SOURCES", "").split(",") if s.strip()]
+
+# Timeouts in seconds, overridable from the environment
+REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "15"))  # single HTTP call
+SOURCE_TIMEOUT = float(os.getenv("SOURCE_TIMEOUT", "45"))  # whole fetcher
+FETCH_DEADLINE = float(os.getenv("FETCH_DEADLINE", "60"))  # all sources together
+
+# Daemon mode: (min, max) seconds between polls; each source sets its own when it
+# registers and the interval moves between the two with how often it has new jobs
+DEFAULT_POLL_INTERVAL = (900, 3600)
+POLL_JITTER = 0.1
+
+# Hacker News scans one item per request, so these bound its cost
+HN_MAX_ITEMS = int(os.getenv("HN_MAX_ITEMS", "50"))
+HN_CONCURRENCY = int(os.getenv("HN_CONCURRENCY", "10"))
+
+def make_session(pool_size=10):
+    """Create a requests session whose keep-alive pool fits `pool_size` parallel calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Shared across fetchers so repeat calls to the same host reuse TLS connections
+SESSION = make_session(pool_size=max(10, HN_CONCURRENCY))
+
+# Jobs already sent are remembered here so each run only notifies about new ones
+SEEN_DB_PATH = os.getenv("SEEN_DB_PATH", "seen_jobs.db")
+SEEN_TTL_DAYS = int(os.getenv("SEEN_TTL_DAYS", "7"))
+SEEN_MAX_ENTRIES = int(os.getenv("SEEN_MAX_ENTRIES", "5000"))
+MAX_JOBS_PER_RUN = 15
+
+# Cross-source dedup: query params that only track where a click came from,
+# and how similar two titles must be (0-1) to count as the same job
+TRACKING_PARAMS = {"ref", "ref_src", "referrer", "fbclid", "gclid", "mc_cid", "mc_eid", "_hsenc", "_hsmi"}
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.7"))
+
+# Feed responses are cached on disk and revalidated with ETag/Last-Modified
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", ".http_cache")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Telegram allows about one message per second per chat, and 20 per minute in a
+# group (group chat IDs are negative); digests pack several jobs per message
+TELEGRAM_MAX_LENGTH = 4096
+TELEGRAM_RATE = float(os.getenv("TELEGRAM_RATE", "1"))  # messages per second
+TELEGRAM_BURST = int(os.getenv("TELEGRAM_BURST", "1"))
+TELEGRAM_PER_MINUTE = int(os.getenv("TELEGRAM_PER_MINUTE", "20" if (CHAT_ID or "").startswith("-") else "0"))  # 0 = no cap
+TELEGRAM_MAX_RETRIES = int(os.getenv("TELEGRAM_MAX_RETRIES", "3"))
+TELEGRAM_DIGEST = os.getenv("TELEGRAM_DIGEST", "1") == "1"
+
+# Metrics export: JSON-lines event log, Prometheus text file, and (daemon only) an HTTP /metrics port
+METRICS_LOG = os.getenv("METRICS_LOG", "")
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")  # "0.0.0.0" to let a remote Prometheus scrape it
+
+# ----------- METRICS -----------
+class Metrics:
+    """Thread-safe counters and timing summaries, labelled by source, stage or host.
+
+    Counters only go up. A summary keeps the count, sum and max of its
+    observations, which is enough for Prometheus rates and averages.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.summaries = {}
+
+    @staticmethod
+    def key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self.key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = self.key(name, labels)
+        with self.lock:
+            count, total, peak = self.summaries.get(key, (0, 0.0, 0.0))
+            self.summaries[key] = (count + 1, total + value, max(peak, value))
+
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def snapshot(self):
+        """Plain dict of every metric, for the JSON log"""
+        with self.lock:
+            counters = [{"name": n, "labels": dict(l), "value": v} for (n, l), v in self.counters.items()]
+            summaries = [
+                {"name": n, "labels": dict(l), "count": c, "sum": round(t, 6), "max": round(m, 6)}
+                for (n, l), (c, t, m) in self.summaries.items()
+            ]
+        return {"counters": counters, "summaries": summaries}
+
+    def to_prometheus(self):
+        """Prometheus text exposition format"""
+        def labels_text(labels):
+            if not labels:
+                return ""
+            pairs = []
+            for key, value in labels:
+                value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                pairs.append(f'{key}="{value}"')
+            return "{" + ",".join(pairs) + "}"
+
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            summaries = sorted(self.summaries.items())
+        typed = set()
+        for (name, labels), value in counters:
+            metric = f"jobbot_{name}_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{labels_text(labels)} {value:g}")
+        # Each family's samples must be contiguous, so the max gauges get their own pass
+        for suffix, kind in (("", "summary"), ("_max", "gauge")):
+            for (name, labels), (count, total, peak) in summaries:
+                metric = f"jobbot_{name}{suffix}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} {kind}")
+                    typed.add(metric)
+                if suffix:
+                    lines.append(f"{metric}{labels_text(labels)} {peak:.6f}")
+                else:
+                    lines.append(f"{metric}_count{labels_text(labels)} {count}")
+                    lines.append(f"{metric}_sum{labels_text(labels)} {total:.6f}")
+        return "\n".join(lines) + "\n"
+
+METRICS = Metrics()
+_log_lock = threading.Lock()
+
+def log_event(event, **fields):
+    """Append one JSON line to METRICS_LOG ("-" for stdout); no-op when it is unset"""
+    if not METRICS_LOG:
+        return
+    line = json.dumps({"ts": datetime.now().isoformat(timespec="milliseconds"), "event": event, **fields}, default=str)
+    with _log_lock:
+        if METRICS_LOG == "-":
+            print(line)
+        else:
+            with open(METRICS_LOG, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+def export_metrics():
+    """Write the Prometheus file and a JSON snapshot of every metric, where configured"""
+    if METRICS_FILE:
+        write_cache_file(METRICS_FILE, METRICS.to_prometheus().encode("utf-8"))
+    log_event("metrics", **METRICS.snapshot())
+
+def serve_metrics(port=METRICS_PORT, host=METRICS_HOST):
+    """Serve METRICS at http://<host>:<port>/metrics from a background thread"""
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+            body = METRICS.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    print(f"📈 Metrics at http://{host}:{server.server_port}/metrics")
+    return server
+
+# Per-thread total of seconds spent waiting on the network, so fetch_source can
+# tell a source's download time apart from its parse time
+_io = threading.local()
+
+def io_seconds():
+    return getattr(_io, "seconds", 0.0)
+
+@contextmanager
+def io_timer():
+    started = time.perf_counter()
     try:
-        response = requests.post(url, data=payload)
-        response.raise_for_status()
-        print(f"✅ Telegram message sent: {message[:50]}...")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to send Telegram message: {e}")
+        yield
+    finally:
+        _io.seconds = io_seconds() + time.perf_counter() - started
+
+def record_request(host, started, status):
+    elapsed = time.perf_counter() - started
+    METRICS.inc("http_requests", host=host, status=status)
+    METRICS.observe("http_request_seconds", elapsed, host=host)
+    return elapsed
+
+# ----------- TELEGRAM DISPATCHER -----------
+class TokenBucket:
+    """Blocking token bucket: `rate` tokens per second, bursts of up to `capacity`"""
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+
+    def acquire(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            self.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 1
+            self.updated = self.clock()
+        self.tokens -= 1
+
+def format_job(job, limit=None):
+    """HTML for one job. With `limit`, the raw title and company are shortened
+    before escaping until the entry fits, so no entity or tag is ever cut."""
+    title, company = job.title, job.company
+    while True:
+        text = (
+            f"💼 <b>{html.escape(title)}</b>\n"
+            f"🏢 {html.escape(company)}\n"
+            f"📅 {job.date_str}\n"
+            f"🔗 {html.escape(job.url)}\n"
+            f"🌍 Source: {job.source}"
+        )
+        if limit is None or len(text) <= limit or not (title or company):
+            return text
+        # Each raw character is at least one escaped one, so dropping `excess` + 1
+        # (room for the ellipsis) from the longer field shrinks the entry enough or empties it
+        excess = len(text) - limit
+        if len(title) >= len(company):
+            title = shorten(title, excess)
+        else:
+            company = shorten(company, excess)
+
+def shorten(value, by):
+    keep = len(value) - by - 1
+    return value[:keep] + "…" if keep > 0 else ""
+
+def pack_digests(jobs, limit=TELEGRAM_MAX_LENGTH):
+    """Group formatted jobs into as few messages as fit Telegram's length limit.
+
+    Returns (text, jobs_in_message) pairs so callers know which jobs each
+    message delivered.
+    """
+    digests = []
+    text, batch = "", []
+    for job in jobs:
+        entry = format_job(job, limit)
+        if batch and len(text) + 2 + len(entry) > limit:
+            digests.append((text, batch))
+            text, batch = "", []
+        text = f"{text}\n\n{entry}" if batch else entry
+        batch.append(job)
+    if batch:
+        digests.append((text, batch))
+    return digests
+
+class TelegramDispatcher:
+    """Sends messages to one chat over a reused session, paced by a token bucket.
+
+    A second bucket enforces `per_minute` when set (group chats). Telegram
+    answers 429 with `parameters.retry_after` when we go too fast anyway;
+    we wait exactly that long and retry. Network errors and 5xx responses
+    back off exponentially. Other errors fail the message straight away.
+    """
+
+    def __init__(self, token=None, chat_id=None, session=None, rate=TELEGRAM_RATE, burst=TELEGRAM_BURST,
+                 per_minute=TELEGRAM_PER_MINUTE, max_retries=TELEGRAM_MAX_RETRIES, sleep=time.sleep):
+        self.token = token or TELEGRAM_TOKEN
+        self.chat_id = chat_id or CHAT_ID
+        self.session = session or make_session(pool_size=2)
+        self.buckets = [TokenBucket(rate, burst, sleep=sleep)]
+        if per_minute:
+            # No burst here: a full bucket would let more than per_minute through in one minute
+            self.buckets.append(TokenBucket(per_minute / 60, 1, sleep=sleep))
+        self.max_retries = max_retries
+        self.sleep = sleep
+
+    def send(self, message: str):
+        if not self.token or not self.chat_id:
+            print("❌ Missing Telegram credentials")
+            return False
+
+        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        payload = {"chat_id": self.chat_id, "text": message, "parse_mode": "HTML"}
+        for attempt in range(self.max_retries + 1):
+            for bucket in self.buckets:
+                bucket.acquire()
+            started = time.perf_counter()
+            try:
+                response = self.session.post(url, data=payload, timeout=REQUEST_TIMEOUT)
+            except requests.RequestException as e:
+                error, delay, reason = self.redact(str(e)), 2 ** attempt, "network"
+            else:
+                METRICS.observe("telegram_send_seconds", time.perf_counter() - started)
+                if response.status_code == 429:
+                    error, delay, reason = "429 Too Many Requests", self.retry_after(response, 2 ** attempt), "429"
+                elif response.status_code >= 500:
+                    error, delay, reason = self.describe(response), 2 ** attempt, "5xx"
+                elif not response.ok:
+                    error = self.describe(response)
+                    print(f"❌ Failed to send Telegram message: {error}")
+                    METRICS.inc("telegram_messages", status="failed")
+                    log_event("telegram_send", ok=False, attempts=attempt + 1, error=error)
+                    return False
+                else:
+                    print(f"✅ Telegram message sent: {message[:50]}...")
+                    METRICS.inc("telegram_messages", status="sent")
+                    log_event("telegram_send", ok=True, attempts=attempt + 1,
+                              seconds=round(time.perf_counter() - started, 4), chars=len(message))
+                    return True
+
+            if attempt < self.max_retries:
+                print(f"⏳ Telegram: {error}, retrying in {delay}s")
+                METRICS.inc("telegram_retries", reason=reason)
+                self.sleep(delay)
+        print(f"❌ Failed to send Telegram message: {error}")
+        METRICS.inc("telegram_messages", status="failed")
+        log_event("telegram_send", ok=False, attempts=self.max_retries + 1, error=error)
         return False
 
-def is_recent_job(job_data, days_limit=3):
+    def redact(self, text):
+        """Error text with the bot token masked (requests puts the full URL in it)"""
+        return text.replace(self.token, "<token>") if self.token else text
+
+    def describe(self, response):
+        """Status code plus Telegram's own error description, never the request URL"""
+        try:
+            description = response.json().get("description", "")
+        except Exception:
+            description = response.reason or ""
+        return self.redact(f"{response.status_code} {description}".strip())
+
+    @staticmethod
+    def retry_after(response, default):
+        try:
+            return response.json()["parameters"]["retry_after"]
+        except Exception:
+            return int(response.headers.get("Retry-After", default))
+
+    def send_jobs(self, jobs, digest=True):
+        """Send job notifications and return the jobs that were delivered"""
+        messages = pack_digests(jobs) if digest else [(format_job(job, TELEGRAM_MAX_LENGTH), [job]) for job in jobs]
+        delivered = []
+        for text, batch in messages:
+            if self.send(text):
+                delivered.extend(batch)
+        return delivered
+
+DISPATCHER = TelegramDispatcher()
+
+def send_telegram(message: str):
+    return DISPATCHER.send(message)
+
+# ----------- DATE PARSING -----------
+def parse_epoch(value):
+    return datetime.fromtimestamp(int(value)).date()
+
+def parse_iso(value):
+    # The first 10 chars of an ISO timestamp are its own calendar date, which is
+    # what fromisoformat(...).date() would give, without parsing the time part
+    return date.fromisoformat(value[:10])
+
+def parse_rfc822(value):
+    # RSS format: "Mon, 27 Dec 2025 10:00:00 +0000"
+    return parsedate_to_datetime(value).date()
+
+DATE_PARSERS = {"epoch": parse_epoch, "iso": parse_iso, "rfc822": parse_rfc822}
+# What a parser raises on a value in some other format (parse_rfc822 gets AttributeError from an int)
+DATE_ERRORS = (ValueError, TypeError, AttributeError, OverflowError, OSError)
+
+class DateParser:
+    """Turns whatever a source uses for dates into a date, or None.
+
+    Feeds use one format throughout, so the format that parsed the last value
+    is tried first and the others only when it fails.
+    """
+
+    def __init__(self):
+        self.last_format = None
+
+    def parse(self, value):
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        if value is None or value == "":
+            return None
+        if isinstance(value, str):
+            value = value.strip()
+        if self.last_format:
+            try:
+                return DATE_PARSERS[self.last_format](value)
+            except DATE_ERRORS:
+                pass
+        for name, parser in DATE_PARSERS.items():
+            if name == self.last_format:
+                continue
+            try:
+                parsed = parser(value)
+            except DATE_ERRORS:
+                continue
+            self.last_format = name
+            return parsed
+        return None
+
+DEFAULT_DATE_PARSER = DateParser()
+
+def is_recent_date(job_date, days_limit=RECENT_DAYS):
+    if job_date is None:
+        return False
+    delta = (date.today() - job_date).days
+    return 0 <= delta <= days_limit
+
+def is_recent_job(job_data, days_limit=RECENT_DAYS):
     """Check if job was posted within the last N days"""
-    today = date.today()
-    
-    # Handle different date formats from different APIs
+    # Handle different date fields from different APIs
     publication_date = job_data.get('publication_date', '') or job_data.get('date', '')
-    
-    if not publication_date:
-        return False
-    
-    # Convert to date object if it's a string
-    if isinstance(publication_date, str):
+    return is_recent_date(DEFAULT_DATE_PARSER.parse(publication_date), days_limit)
+
+# ----------- KEYWORD MATCHER -----------
+def compile_terms(terms, word_boundaries=True, overlapping=False):
+    """Compile terms into one case-insensitive alternation regex, or None if there are none.
+
+    With `overlapping`, the match is zero-width with the term in group 1, so
+    finditer reports a hit at every position a term starts, even inside another hit.
+    """
+    if not terms:
+        return None
+    # Longest first so "backend engineer" wins over "backend" at the same position
+    alternatives = [r"\s+".join(map(re.escape, t.split())) for t in sorted(set(terms), key=len, reverse=True)]
+    pattern = "|".join(alternatives)
+    if word_boundaries:
+        # Lookarounds instead of \b so terms that start or end with symbols (c++, .net) still work
+        pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+    if overlapping:
+        pattern = rf"(?=({pattern}))"
+    return re.compile(pattern, re.IGNORECASE)
+
+class KeywordMatcher:
+    """Matches text against a keyword set compiled once into a single regex.
+
+    A job matches when the summed weight of the distinct keywords found reaches
+    `min_score` and no exclude term appears. Each keyword counts on its own, so
+    "backend engineer" in the text also counts "backend". With the defaults
+    this is the same as "any keyword appears as a whole word".
+    """
+
+    def __init__(self, keywords, exclude=(), weights=None, min_score=1, word_boundaries=True):
+        self.weights = {" ".join(k.lower().split()): 1 for k in keywords}
+        for keyword, weight in (weights or {}).items():
+            self.weights[" ".join(keyword.lower().split())] = weight
+        self.min_score = min_score
+        self.pattern = compile_terms(list(self.weights), word_boundaries)
+        # Scoring is one overlapping pass that finds the longest keyword at each
+        # start; `implied` adds the keywords inside it ("backend engineer" -> "backend")
+        self.score_pattern = compile_terms(list(self.weights), word_boundaries, overlapping=True)
+        term_patterns = {k: compile_terms([k], word_boundaries) for k in self.weights}
+        self.implied = {k: {t for t, p in term_patterns.items() if p.search(k)} for k in self.weights}
+        self.exclude_pattern = compile_terms(list(exclude), word_boundaries)
+        # When any single keyword is enough, the first hit decides and we can stop scanning
+        self.any_hit_matches = all(w >= min_score for w in self.weights.values())
+
+    @property
+    def fingerprint(self):
+        """Hash of every setting that decides a match, to tell when saved match results are stale"""
+        settings = [
+            sorted(self.weights.items()),
+            self.min_score,
+            self.pattern and self.pattern.pattern,
+            self.exclude_pattern and self.exclude_pattern.pattern,
+        ]
+        return hashlib.sha1(json.dumps(settings).encode("utf-8")).hexdigest()
+
+    def excluded(self, text):
+        return bool(self.exclude_pattern and self.exclude_pattern.search(text))
+
+    def score(self, text):
+        """Summed weight of the distinct keywords in `text`; 0 if it hits an exclude term"""
+        if not self.pattern or self.excluded(text):
+            return 0
+        found = set()
+        for m in self.score_pattern.finditer(text):
+            found |= self.implied.get(" ".join(m.group(1).lower().split()), set())
+        return sum(self.weights[k] for k in found)
+
+    def matches(self, text):
+        if not self.pattern or not text:
+            return False
+        if self.any_hit_matches:
+            return bool(self.pattern.search(text)) and not self.excluded(text)
+        return self.score(text) >= self.min_score
+
+MATCHER = KeywordMatcher(KEYWORDS, EXCLUDE_KEYWORDS, KEYWORD_WEIGHTS, MIN_KEYWORD_SCORE)
+
+# ----------- HTTP CACHE -----------
+class CachedResponse:
+    """The parts of a requests.Response the fetchers use, filled from the network or disk.
+
+    The body is streamed from wherever it lives (memory, cache file or live
+    connection) by iter_content(); `.content` only materializes it on demand.
+    """
+
+    def __init__(self, url, content=None, body_path=None, stream=None, from_cache=False, revalidated=False,
+                 cache_path=None):
+        self.url = url
+        self.status_code = 200
+        self.from_cache = from_cache  # body came from disk
+        self.revalidated = revalidated  # server answered 304 Not Modified
+        self.cache_path = cache_path or body_path  # where the body is (or will be) cached
+        self._content = content
+        self._body_path = body_path
+        self._stream = stream
+
+    @property
+    def validator(self):
+        """Identity of the cached body, or None when it isn't cached; changes whenever a new body is stored"""
+        try:
+            stat = os.stat(self.cache_path)
+        except (TypeError, OSError):
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def iter_content(self, chunk_size=STREAM_CHUNK_SIZE):
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i:i + chunk_size]
+        elif self._body_path:
+            with open(self._body_path, "rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+        elif self._stream:
+            yield from self._stream(chunk_size)
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = b"".join(self.iter_content())
+        return self._content
+
+    def json(self):
+        return json.loads(self.content)
+
+def parse_max_age(cache_control):
+    """Seconds a response may be reused without asking the server, or None if it must not be stored"""
+    directives = [d.strip().lower() for d in (cache_control or "").split(",")]
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    for directive in directives:
+        if directive.startswith("max-age="):
+            try:
+                return max(0, int(directive.split("=", 1)[1]))
+            except ValueError:
+                return 0
+    return 0
+
+def write_cache_file(path, data):
+    # Write then rename so a crash never leaves a half-written cache entry
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def cached_get(url, headers=None, cache_dir=None, session=None):
+    """GET `url` through the on-disk cache.
+
+    A body still inside its Cache-Control max-age is returned without a
+    request. Otherwise the stored ETag/Last-Modified are sent as
+    If-None-Match/If-Modified-Since, and a 304 reuses the stored body.
+    Fresh bodies are streamed to the caller and the cache file together,
+    so a large feed is never held in memory in one piece.
+    """
+    cache_dir = cache_dir or HTTP_CACHE_DIR
+    session = session or SESSION
+    base = os.path.join(cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest())
+    meta_path, body_path = f"{base}.json", f"{base}.body"
+
+    meta = None
+    if os.path.exists(meta_path) and os.path.exists(body_path):
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+
+    host = urlsplit(url).netloc
+    if meta and time.time() - meta["fetched_at"] < meta.get("max_age", 0):
+        METRICS.inc("http_cache", host=host, result="fresh")
+        return CachedResponse(url, body_path=body_path, from_cache=True)
+
+    request_headers = dict(headers or {})
+    if meta:
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    started = time.perf_counter()
+    with io_timer():
+        response = session.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT, stream=True)
+    elapsed = record_request(host, started, response.status_code)
+    log_event("http_request", host=host, url=url, status=response.status_code, seconds=round(elapsed, 4))
+    max_age = parse_max_age(response.headers.get("Cache-Control"))
+
+    if response.status_code == 304 and meta:
+        METRICS.inc("http_cache", host=host, result="revalidated")
+        response.close()
+        meta["fetched_at"] = time.time()
+        # The server may rotate its validators on a 304; keep whatever it sent last
+        for header, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+            if response.headers.get(header):
+                meta[key] = response.headers[header]
+        if max_age is not None:
+            meta["max_age"] = max_age
+        write_cache_file(meta_path, json.dumps(meta).encode("utf-8"))
+        return CachedResponse(url, body_path=body_path, from_cache=True, revalidated=True)
+
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    METRICS.inc("http_cache", host=host, result="miss")
+
+    def network_chunks(chunk_size):
+        body = response.iter_content(chunk_size)
+        while True:
+            with io_timer():
+                chunk = next(body, None)
+            if chunk is None:
+                return
+            METRICS.inc("http_bytes", len(chunk), host=host)
+            yield chunk
+
+    has_validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+    if max_age is None or not (has_validator or max_age > 0):
+        return CachedResponse(url, stream=network_chunks)
+
+    new_meta = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+        "max_age": max_age,
+    }
+
+    def tee(chunk_size):
+        # Copy chunks to the cache as the caller consumes them; the entry is
+        # only committed once the whole body has been read
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{body_path}.tmp"
+        complete = False
         try:
-            # Handle various date formats
-            if 'T' in publication_date:
-                # ISO format: "2023-11-26T10:30:00"
-                job_date = datetime.fromisoformat(publication_date.replace('Z', '+00:00')).date()
+            with open(tmp_path, "wb") as f:
+                for chunk in network_chunks(chunk_size):
+                    f.write(chunk)
+                    yield chunk
+            complete = True
+        finally:
+            response.close()
+            if complete:
+                os.replace(tmp_path, body_path)
+                write_cache_file(meta_path, json.dumps(new_meta).encode("utf-8"))
+            elif os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return CachedResponse(url, stream=tee, cache_path=body_path)
+
+# ----------- STREAMING PARSERS -----------
+JSON_SEPARATORS = " \t\r\n,"
+JSON_CLOSERS = JSON_SEPARATORS + "]"
+
+def iter_json_array(chunks, key=None):
+    """Yield the elements of a JSON array one at a time from a stream of byte chunks.
+
+    With `key`, the array is the value of that key in the top-level object
+    (e.g. Remotive's "jobs"); otherwise the document itself is the array.
+    Only the element being decoded is buffered, never the whole payload.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buf = ""
+
+    if key:
+        find_start = re.compile(rf'"{re.escape(key)}"\s*:\s*\[').search
+    else:
+        find_start = re.compile(r"\s*\[").match
+    while not (start := find_start(buf)):
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError(f"JSON array {key!r} not found in payload" if key else "JSON array not found in payload")
+        buf += utf8.decode(chunk)
+    buf, pos = buf[start.end():], 0
+
+    ended = False
+    while True:
+        while pos < len(buf) and buf[pos] in JSON_SEPARATORS:
+            pos += 1
+        if pos < len(buf):
+            if buf[pos] == "]":
+                # Drain the rest so a caching stream sees the full body
+                for _ in chunks:
+                    pass
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                pass  # element continues in the next chunk
             else:
-                # Simple date format: "2023-11-26"
-                job_date = datetime.strptime(publication_date, "%Y-%m-%d").date()
-            
-            delta = (today - job_date).days
-            return 0 <= delta <= days_limit
-        except (ValueError, AttributeError) as e:
-            # print(f"Date parse error: {e} for {publication_date}")
-            return False
-            
-    # If it's already a date/datetime object
-    if isinstance(publication_date, (date, datetime)):
-        if isinstance(publication_date, datetime):
-            publication_date = publication_date.date()
-        delta = (today - publication_date).days
-        return 0 <= delta <= days_limit
-    
-    return False
+                # A value may go on in the next chunk ("12" of "1234", "1" of "1.5"),
+                # so it only counts once a separator or the closing "]" follows it
+                if ended or (end < len(buf) and buf[end] in JSON_CLOSERS):
+                    yield item
+                    pos = end
+                    continue
+        if ended:
+            raise ValueError("JSON array ended unexpectedly")
+        chunk = next(chunks, None)
+        if chunk is None:
+            ended = True
+            chunk = b""
+        buf = buf[pos:] + utf8.decode(chunk, final=ended)
+        pos = 0
 
-# ----------- REMOTIVE JOBS API -----------
-def fetch_remotive():
-    print("🔍 Fetching from Remotive...")
+def iter_xml_items(chunks, tag="item"):
+    """Yield each <tag> element of an XML stream, clearing it once the caller is done.
+
+    Uses XMLPullParser, the push-fed form of iterparse, so it can consume the
+    same chunk stream as the JSON feeds.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == tag:
+                yield elem
+                elem.clear()
+    parser.close()
+    for _, elem in parser.read_events():
+        if elem.tag == tag:
+            yield elem
+            elem.clear()
+
+# ----------- SOURCES -----------
+@dataclass(slots=True)
+class Job:
+    """One job posting, normalized the same way for every source"""
+    title: str
+    company: str
+    url: str
+    source: str
+    posted: Optional[date] = None
+
+    @property
+    def date_str(self):
+        return self.posted.strftime("%Y-%m-%d") if self.posted else "Recent"
+
+@dataclass
+class SourcePlugin:
+    """A job board. `iter_jobs(parse_date, **options)` yields a (Job, match_text)
+    pair for every posting it scans; filtering happens in fetch_source().
+    With `cached_feed`, iter_jobs also takes a `get` to download its feed with,
+    which lets fetch_source() skip the parse when the feed has not changed."""
+    name: str
+    iter_jobs: Callable
+    enabled: bool = True
+    undated_is_recent: bool = False  # feeds that only list recent posts
+    cached_feed: bool = False
+    poll_interval: tuple = DEFAULT_POLL_INTERVAL  # daemon (min, max) seconds
+    date_parser: DateParser = field(default_factory=DateParser)
+
+SOURCE_REGISTRY = {}
+
+def register_source(name, **settings):
+    """Decorator that adds a job-board generator to SOURCE_REGISTRY"""
+    def decorator(iter_jobs):
+        SOURCE_REGISTRY[name] = SourcePlugin(name, iter_jobs, **settings)
+        return iter_jobs
+    return decorator
+
+class FeedUnchanged(Exception):
+    """Raised by fetch_source()'s feed getter when the cached body is the one parsed last time"""
+
+def parsed_feed_path(name):
+    return os.path.join(HTTP_CACHE_DIR, f"{hashlib.sha1(f'parsed:{name}'.encode('utf-8')).hexdigest()}.parsed.json")
+
+def filter_settings():
+    """What the saved matches of a feed depend on besides its body"""
+    return f"{MATCHER.fingerprint}:{RECENT_DAYS}"
+
+def load_parsed_feed(name):
+    """(cache validators, matching jobs) from the last full parse of `name`, or None.
+
+    Matches saved under different keyword or recency settings are ignored.
+    """
     try:
-        url = "https://remotive.com/api/remote-jobs"
-        data = requests.get(url).json()
-        jobs = data["jobs"]
-        print(f"📊 Remotive: Found {len(jobs)} total jobs")
+        with open(parsed_feed_path(name), encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("settings") != filter_settings():
+            return None
+        jobs = [
+            Job(**{**job, "posted": date.fromisoformat(job["posted"]) if job["posted"] else None})
+            for job in saved["jobs"]
+        ]
+        return [tuple(v) for v in saved["validators"]], jobs
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
-        results = []
-        for job in jobs:
-            # Check if job matches keywords AND is recent
-            text = f"{job['title']} {job['description']}".lower()
-            if any(k in text for k in KEYWORDS) and is_recent_job(job):
-                results.append({
-                    "title": job["title"],
-                    "company": job["company_name"],
-                    "url": job["url"],
-                    "source": "Remotive",
-                    "date": job.get("publication_date", "Unknown")
-                })
-        print(f"✅ Remotive: {len(results)} matching recent jobs")
-        return results
-    except Exception as e:
-        print(f"❌ Remotive error: {e}")
-        return []
+def save_parsed_feed(name, validators, jobs):
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    saved = {
+        "settings": filter_settings(),
+        "validators": validators,
+        "jobs": [{**asdict(job), "posted": job.posted.isoformat() if job.posted else None} for job in jobs],
+    }
+    write_cache_file(parsed_feed_path(name), json.dumps(saved).encode("utf-8"))
+
+def fetch_source(name, **options):
+    """Scan one registered source and return its recent jobs that match KEYWORDS.
+
+    For a cached feed whose body is the same one parsed last time (a fresh
+    cache hit or a 304), the matches saved from that parse are reused and
+    only their dates are checked again.
+    """
+    plugin = SOURCE_REGISTRY[name]
+    print(f"🔍 Fetching from {name}...")
+
+    def is_recent(job):
+        return is_recent_date(job.posted) if job.posted else plugin.undated_is_recent
+
+    responses = []
+    previous = load_parsed_feed(name) if plugin.cached_feed else None
+    if plugin.cached_feed:
+        def get(url, **kwargs):
+            response = cached_get(url, **kwargs)
+            responses.append(response)
+            if response.from_cache and previous and previous[0] == [r.validator for r in responses]:
+                raise FeedUnchanged(url)
+            return response
+        options["get"] = get
+
+    results = []
+    scanned = 0
+    unchanged = False
+    # Time spent inside the plugin generator (download + streaming parse, split apart below) vs. in our filter
+    parse_seconds = filter_seconds = 0.0
+    jobs = plugin.iter_jobs(plugin.date_parser.parse, **options)
+    started = time.perf_counter()
+    io_started = io_seconds()
+    while True:
+        before = time.perf_counter()
+        try:
+            job, text = next(jobs)
+        except StopIteration:
+            parse_seconds += time.perf_counter() - before
+            break
+        except FeedUnchanged:
+            parse_seconds += time.perf_counter() - before
+            # Jobs only get older, so last parse's matches are a superset of today's
+            results = [job for job in previous[1] if is_recent(job)]
+            unchanged = True
+            break
+        parsed = time.perf_counter()
+        parse_seconds += parsed - before
+        scanned += 1
+        # Date first: it is already parsed, so it is far cheaper than the text scan
+        if is_recent(job) and MATCHER.matches(text):
+            results.append(job)
+        filter_seconds += time.perf_counter() - parsed
+    total_seconds = time.perf_counter() - started
+    # The generator also waits on the network while it streams the body; keep
+    # that out of the parse time
+    download_seconds = io_seconds() - io_started
+    parse_seconds = max(0.0, parse_seconds - download_seconds)
+
+    if plugin.cached_feed and not unchanged:
+        validators = [r.validator for r in responses]
+        if validators and None not in validators:
+            save_parsed_feed(name, validators, results)
+    if unchanged:
+        METRICS.inc("feeds_unchanged", source=name)
+        print(f"♻️ {name}: feed unchanged, reusing the last parse")
+
+    METRICS.inc("items_scanned", scanned, source=name)
+    METRICS.inc("items_matched", len(results), source=name)
+    METRICS.observe("source_seconds", total_seconds, source=name)
+    METRICS.observe("download_seconds", download_seconds, source=name)
+    METRICS.observe("parse_seconds", parse_seconds, source=name)
+    METRICS.observe("filter_seconds", filter_seconds, source=name)
+    log_event("source", source=name, scanned=scanned, matched=len(results), unchanged=unchanged,
+              seconds=round(total_seconds, 4), download_seconds=round(download_seconds, 4),
+              parse_seconds=round(parse_seconds, 4), filter_seconds=round(filter_seconds, 4))
+    print(f"📊 {name}: Scanned {scanned} total jobs")
+    print(f"✅ {name}: {len(results)} matching recent jobs")
+    return results
+
+def enabled_sources():
+    """(name, fetch) pairs for the sources to run, from ENABLED_SOURCES or each plugin's default"""
+    if ENABLED_SOURCES:
+        unknown = [name for name in ENABLED_SOURCES if name not in SOURCE_REGISTRY]
+        if unknown:
+            print(f"⚠️ Unknown sources in ENABLED_SOURCES: {', '.join(unknown)}")
+        names = [name for name in ENABLED_SOURCES if name in SOURCE_REGISTRY]
+    else:
+        names = [name for name, plugin in SOURCE_REGISTRY.items() if plugin.enabled]
+    return [(name, partial(fetch_source, name)) for name in names]
+
+# ----------- REMOTIVE JOBS API -----------
+@register_source("Remotive", cached_feed=True, poll_interval=(600, 3600))
+def iter_remotive(parse_date, get=cached_get):
+    url = "https://remotive.com/api/remote-jobs"
+    # Stream the "jobs" array so only one full description is in memory at a time
+    for job in iter_json_array(get(url).iter_content(), key="jobs"):
+        yield Job(
+            title=job["title"],
+            company=job["company_name"],
+            url=job["url"],
+            source="Remotive",
+            posted=parse_date(job.get("publication_date")),
+        ), f"{job['title']} {job['description']}"
+
+def fetch_remotive():
+    return fetch_source("Remotive")
 
 # ----------- REMOTEOK API -----------
+@register_source("RemoteOK", cached_feed=True, poll_interval=(600, 3600))
+def iter_remoteok(parse_date, get=cached_get):
+    url = "https://remoteok.io/api"
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    jobs = iter_json_array(get(url, headers=headers).iter_content())
+    next(jobs, None)  # Skip first element (metadata)
+    for job in jobs:
+        link = job.get("url") or ""
+        if not link.startswith("http"):
+            link = f"https://remoteok.io{link}"
+        yield Job(
+            title=job.get("position") or "",
+            company=job.get("company") or "",
+            url=link,
+            source="RemoteOK",
+            # RemoteOK uses timestamp in seconds, with an ISO "date" as fallback
+            posted=parse_date(job.get("epoch") or job.get("date")),
+        ), f"{job.get('position', '')} {job.get('description', '')}"
+
 def fetch_remoteok():
-    print("🔍 Fetching from RemoteOK...")
-    try:
-        url = "https://remoteok.io/api"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers)
-        data = response.json()
-        print(f"📊 RemoteOK: Found {len(data)-1} total jobs")
-
-        results = []
-        for job in data[1:]:  # Skip first element (metadata)
-            # RemoteOK uses timestamp in seconds
-            job_timestamp = job.get('epoch', job.get('date'))
-            if job_timestamp:
-                try:
-                    job_date = datetime.fromtimestamp(int(job_timestamp)).date()
-                    # Check if recent
-                    delta = (date.today() - job_date).days
-                    is_recent = 0 <= delta <= 3
-                except:
-                    is_recent = False
-            else:
-                is_recent = False
-            
-            text = f"{job.get('position', '')} {job.get('description', '')}".lower()
-            if any(k in text for k in KEYWORDS) and is_recent:
-                results.append({
-                    "title": job.get("position"),
-                    "company": job.get("company"),
-                    "url": f"https://remoteok.io{job.get('url', '')}",
-                    "source": "RemoteOK",
-                    "date": job_date.strftime("%Y-%m-%d")
-                })
-        print(f"✅ RemoteOK: {len(results)} matching recent jobs")
-        return results
-    except Exception as e:
-        print(f"❌ RemoteOK error: {e}")
-        return []
+    return fetch_source("RemoteOK")
 
 # ----------- WE WORK REMOTELY (RSS) -----------
+# Only the most recent posts are in the RSS feed, so undated items count as recent
+@register_source("WeWorkRemotely", undated_is_recent=True, cached_feed=True, poll_interval=(900, 3600))
+def iter_wwr(parse_date, get=cached_get):
+    # We Work Remotely has an RSS feed which is easier to parse than scraping HTML
+    url = "https://weworkremotely.com/remote-jobs.rss"
+    # Items are parsed and discarded one at a time instead of building the whole tree
+    for item in iter_xml_items(get(url).iter_content()):
+        title = item.findtext('title') or ""
+        yield Job(
+            title=title,
+            company="WeWorkRemotely Job",  # WWR RSS often puts company in title "Company: Role"
+            url=item.findtext('link') or "",
+            source="WeWorkRemotely",
+            posted=parse_date(item.findtext('pubDate')),
+        ), f"{title} {item.findtext('description') or ''}"
+
 def fetch_wwr():
-    print("🔍 Fetching from WeWorkRemotely...")
-    try:
-        # We Work Remotely has an RSS feed which is easier to parse than scraping HTML
-        url = "https://weworkremotely.com/remote-jobs.rss"
-        response = requests.get(url) 
-        # Simple XML parsing using string manipulation to avoid complex dependencies
-        # In a production app, use 'feedparser' or 'xml.etree.ElementTree'
-        import xml.etree.ElementTree as ET
-        
-        try:
-            root = ET.fromstring(response.content)
-            items = root.findall('.//item')
-            print(f"📊 WWR: Found {len(items)} total jobs in feed")
-            
-            results = []
-            for item in items:
-                title = item.find('title').text if item.find('title') is not None else ""
-                description = item.find('description').text if item.find('description') is not None else ""
-                link = item.find('link').text if item.find('link') is not None else ""
-                pubDate = item.find('pubDate').text if item.find('pubDate') is not None else ""
-                
-                # WWR format: "Mon, 27 Dec 2025 10:00:00 +0000"
-                try:
-                    # Parse simplified date
-                    job_dt = datetime.strptime(pubDate.split('+')[0].strip(), "%a, %d %b %Y %H:%M:%S")
-                    job_data = {'date': job_dt.date()}
-                    is_recent = is_recent_job(job_data)
-                    date_str = job_dt.strftime("%Y-%m-%d")
-                except:
-                    is_recent = True # Only most recent 50 are in RSS usually, so assume recent
-                    date_str = "Recent"
-
-                text = f"{title} {description}".lower()
-                if any(k in text for k in KEYWORDS) and is_recent:
-                    results.append({
-                        "title": title,
-                        "company": "WeWorkRemotely Job", # WWR RSS often puts company in title "Company: Role"
-                        "url": link,
-                        "source": "WeWorkRemotely",
-                        "date": date_str
-                    })
-            
-            print(f"✅ WWR: {len(results)} matching recent jobs")
-            return results
-            
-        except ET.ParseError:
-            print("❌ WWR XML Parse Error")
-            return []
-            
-    except Exception as e:
-        print(f"❌ WWR error: {e}")
-        return []
+    return fetch_source("WeWorkRemotely")
 
 # ----------- HACKER NEWS (WHO IS HIRING) -----------
-def fetch_hackernews():
-    print("🔍 Fetching from Hacker News...")
+def get_json(url):
+    """Plain (uncached) GET through the shared session, recorded in METRICS"""
+    host = urlsplit(url).netloc
+    started = time.perf_counter()
+    with io_timer():
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    record_request(host, started, response.status_code)
+    METRICS.inc("http_bytes", len(response.content), host=host)
+    return response.json()
+
+def fetch_hn_item(jid):
+    """Fetch a single HN item, returning None instead of raising on failure"""
+    item_url = f"https://hacker-news.firebaseio.com/v0/item/{jid}.json"
     try:
-        # Fetch top job stories
-        url = "https://hacker-news.firebaseio.com/v0/jobstories.json"
-        job_ids = requests.get(url).json()[:50] # Check top 50
-        print(f"📊 Hacker News: Checking top {len(job_ids)} job posts")
-        
-        results = []
-        for jid in job_ids:
-            item_url = f"https://hacker-news.firebaseio.com/v0/item/{jid}.json"
-            job = requests.get(item_url).json()
-            
-            if not job or 'title' not in job:
+        return get_json(item_url)
+    except Exception as e:
+        print(f"⚠️ Hacker News item {jid} failed: {e}")
+        return None
+
+@register_source("Hacker News", undated_is_recent=True, poll_interval=(180, 1800))
+def iter_hackernews(parse_date, max_items=None, concurrency=None):
+    max_items = HN_MAX_ITEMS if max_items is None else max_items
+    concurrency = HN_CONCURRENCY if concurrency is None else concurrency
+    # Fetch top job stories
+    url = "https://hacker-news.firebaseio.com/v0/jobstories.json"
+    job_ids = get_json(url)[:max_items]
+
+    # Items are independent, so fetch them in parallel over the shared pool;
+    # map() keeps the original ranking order
+    with io_timer():
+        items = [future.result() for future in daemon_map(fetch_hn_item, job_ids, concurrency, name="hn")]
+
+    for jid, job in zip(job_ids, items):
+        if not job or 'title' not in job:
+            continue
+        # HN jobs are usually just a title/text, sometimes url
+        title = job.get('title', 'Unknown')
+        yield Job(
+            title=title,
+            company="Hacker News",
+            url=job.get('url', f"https://news.ycombinator.com/item?id={jid}"),
+            source="Hacker News",
+            posted=parse_date(job.get('time')),
+        ), f"{title} {job.get('text', '') or ''}"
+
+def fetch_hackernews(max_items=None, concurrency=None):
+    return fetch_source("Hacker News", max_items=max_items, concurrency=concurrency)
+
+# ----------- SEEN JOBS STORE -----------
+def normalize_url(url):
+    """Canonical form of a job URL so the same posting keys the same wherever it was linked from.
+
+    Drops tracking parameters, the fragment, a trailing slash and a leading
+    "www.", sorts the remaining query, and treats http and https alike.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not (k.lower() in TRACKING_PARAMS or k.lower().startswith("utm_"))
+    ))
+    return urlunsplit((scheme, host, parts.path.rstrip("/"), query, ""))
+
+def job_key(job):
+    """Stable hash for a job: its normalized URL, or company + title when there is no URL"""
+    ident = normalize_url(job.url) or f"{job.company}|{job.title}".lower()
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+def title_key(job):
+    """Hash of the normalized (company, title), so one posting on several boards keys the same;
+    None when the company is unknown, as a bare title says too little"""
+    company, title = company_and_title(job)
+    if not company or not title:
+        return None
+    return hashlib.sha1(f"{company}|{title}".encode("utf-8")).hexdigest()
+
+class SeenJobs:
+    """SQLite-backed index of jobs already sent, with TTL eviction and a size bound.
+
+    Keys are loaded into a set on open so membership checks are O(1); the
+    table never holds more than `max_entries` rows, so neither does the set.
+    Each job is remembered by its URL and by its (company, title), so a copy
+    on another board is recognized even when it turns up in a later run.
+    """
+
+    def __init__(self, path=SEEN_DB_PATH, ttl_days=SEEN_TTL_DAYS, max_entries=SEEN_MAX_ENTRIES):
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_jobs "
+            "(key TEXT PRIMARY KEY, url TEXT, seen_at REAL NOT NULL, title_key TEXT)"
+        )
+        # Stores written before title keys existed
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(seen_jobs)")}
+        if "title_key" not in columns:
+            self.conn.execute("ALTER TABLE seen_jobs ADD COLUMN title_key TEXT")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS seen_jobs_seen_at ON seen_jobs (seen_at)")
+        self.keys = set()
+        self.title_keys = set()
+        self.prune()
+
+    def __contains__(self, job):
+        return job_key(job) in self.keys or title_key(job) in self.title_keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def filter_new(self, jobs):
+        """Return jobs not seen before, also dropping repeats within `jobs` itself"""
+        new_jobs, batch_keys, batch_title_keys = [], set(), set()
+        for job in jobs:
+            key, tkey = job_key(job), title_key(job)
+            if key in self.keys or key in batch_keys or tkey in self.title_keys or tkey in batch_title_keys:
                 continue
-                
-            # HN jobs are usually just a title/text, sometimes url
-            title = job.get('title', 'Unknown')
-            text = job.get('text', '') or title
-            
-            # Check date
-            job_time = job.get('time')
-            if job_time:
-                job_date = datetime.fromtimestamp(job_time).date()
-                if not is_recent_job({'date': job_date}):
+            batch_keys.add(key)
+            if tkey:
+                batch_title_keys.add(tkey)
+            new_jobs.append(job)
+        return new_jobs
+
+    def add(self, jobs):
+        now = time.time()
+        rows = [(job_key(job), job.url, now, title_key(job)) for job in jobs]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO seen_jobs (key, url, seen_at, title_key) VALUES (?, ?, ?, ?)", rows
+            )
+        self.keys.update(row[0] for row in rows)
+        self.title_keys.update(row[3] for row in rows if row[3])
+        if len(self.keys) > self.max_entries:
+            self.prune()
+
+    def prune(self):
+        """Evict expired entries, then the oldest ones beyond max_entries"""
+        with self.conn:
+            self.conn.execute("DELETE FROM seen_jobs WHERE seen_at < ?", (time.time() - self.ttl_seconds,))
+            self.conn.execute(
+                "DELETE FROM seen_jobs WHERE key NOT IN "
+                "(SELECT key FROM seen_jobs ORDER BY seen_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+        rows = self.conn.execute("SELECT key, title_key FROM seen_jobs").fetchall()
+        self.keys = {key for key, _ in rows}
+        self.title_keys = {tkey for _, tkey in rows if tkey}
+
+    def close(self):
+        self.conn.close()
+
+# ----------- DEDUPLICATION -----------
+# Fetchers fill "company" with these when the board does not expose it
+GENERIC_COMPANIES = {"weworkremotely job", "hacker news"}
+# Legal suffixes dropped so "Acme Inc." and "Acme" compare equal
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "gmbh", "corp", "co"}
+# Words that make otherwise similar titles different jobs; they must match exactly
+SENIORITY_WORDS = {"intern", "junior", "jr", "mid", "senior", "sr", "staff", "principal", "lead", "head"}
+# Parenthesized words that describe the posting rather than the role, e.g. "(Remote)"
+QUALIFIER_NOISE = {"remote", "worldwide", "anywhere", "hybrid", "full", "part", "time", "contract", "us", "eu", "uk"}
+
+MINHASH_BANDS = 10
+MINHASH_ROWS = 3
+MINHASH_PRIME = (1 << 61) - 1
+# (a, b) pairs for the hash family h(x) = (a*x + b) mod p, fixed so signatures are reproducible
+MINHASH_SEEDS = [
+    ((2 * i + 1) * 0x9E3779B97F4A7C15 % MINHASH_PRIME, (i + 1) * 0xC2B2AE3D27D4EB4F % MINHASH_PRIME)
+    for i in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+def normalize_text(text):
+    return " ".join(re.sub(r"[^\w+#]+", " ", str(text or "").lower()).split())
+
+def normalize_company(company):
+    words = normalize_text(company).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+def company_and_title(job):
+    """Normalized (company, title), taking the company from a "Company: Role" title when it is unknown.
+
+    The company is "" when it cannot be told at all.
+    """
+    company = normalize_text(job.company)
+    title = job.title
+    if company in GENERIC_COMPANIES or not company:
+        company = ""
+        if ":" in title:
+            company, title = title.split(":", 1)
+    return normalize_company(company), normalize_text(title)
+
+def title_qualifiers(title):
+    """Seniority words plus meaningful parenthesized words, e.g. {"senior", "go"} for "Senior Engineer (Go)" """
+    qualifiers = set(normalize_text(title).split()) & SENIORITY_WORDS
+    for inner in re.findall(r"\(([^)]*)\)", title):
+        qualifiers |= set(normalize_text(inner).split()) - QUALIFIER_NOISE
+    return frozenset(qualifiers)
+
+def shingles(text, size=3):
+    text = f" {text} "
+    return {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+
+def minhash(shingle_set):
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingle_set]
+    return [min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in MINHASH_SEEDS]
+
+class DedupIndex:
+    """Recognizes the same job posted on several boards.
+
+    A job is a duplicate if it has the canonical URL or normalized
+    (company, title) of one already indexed. For a known company it is also a
+    duplicate when a job at the same company has the same seniority and
+    parenthesized qualifiers and a title at least `threshold` Jaccard-similar
+    by character shingles. Near-duplicates are found with MinHash + LSH
+    banding keyed by company, so a job is only compared with the few titles
+    at its own company that share a band. Jobs with an unknown company are
+    only matched by URL or exact key.
+    """
+
+    def __init__(self, threshold=DEDUP_THRESHOLD):
+        self.threshold = threshold
+        self.urls = set()
+        self.keys = set()
+        self.entries = []  # (shingles, qualifiers) per fuzzy-indexed job
+        self.buckets = {}  # (company, band number, band) -> entry indexes
+
+    def add(self, job):
+        """Index `job` and return True, or return False if it duplicates an indexed job"""
+        url = normalize_url(job.url)
+        company, title = company_and_title(job)
+        key = (company, title)
+        if (url and url in self.urls) or (title and key in self.keys):
+            return False
+
+        fuzzy = bool(company and title)
+        if fuzzy:
+            title_shingles = shingles(title)
+            qualifiers = title_qualifiers(job.title)
+            signature = minhash(title_shingles)
+            band_keys = [
+                (company, b, tuple(signature[b * MINHASH_ROWS:(b + 1) * MINHASH_ROWS]))
+                for b in range(MINHASH_BANDS)
+            ]
+            candidates = set()
+            for band_key in band_keys:
+                candidates.update(self.buckets.get(band_key, ()))
+            for i in candidates:
+                other_shingles, other_qualifiers = self.entries[i]
+                if other_qualifiers != qualifiers:
                     continue
-                date_str = job_date.strftime("%Y-%m-%d")
-            else:
-                date_str = "Recent"
-            
-            content_to_check = f"{title} {text}".lower()
-            
-            if any(k in content_to_check for k in KEYWORDS):
-                results.append({
-                    "title": title,
-                    "company": "Hacker News",
-                    "url": job.get('url', f"https://news.ycombinator.com/item?id={jid}"),
-                    "source": "Hacker News",
-                    "date": date_str
-                })
-                
-        print(f"✅ Hacker News: {len(results)} matching recent jobs")
-        return results
-    except Exception as e:
-        print(f"❌ Hacker News error: {e}")
-        return []
+                if len(title_shingles & other_shingles) / len(title_shingles | other_shingles) >= self.threshold:
+                    return False
+
+        if url:
+            self.urls.add(url)
+        if title:
+            self.keys.add(key)
+        if fuzzy:
+            index = len(self.entries)
+            self.entries.append((title_shingles, qualifiers))
+            for band_key in band_keys:
+                self.buckets.setdefault(band_key, []).append(index)
+        return True
+
+def dedup_jobs(jobs, threshold=DEDUP_THRESHOLD):
+    """Drop cross-source duplicates, keeping the first occurrence of each job"""
+    index = DedupIndex(threshold)
+    return [job for job in jobs if index.add(job)]
+
+# ----------- CONCURRENT FETCH ENGINE -----------
+def daemon_map(fn, items, workers, name="worker"):
+    """Start fn(item) for every item on at most `workers` daemon threads; returns Futures in item order.
+
+    ThreadPoolExecutor's workers are joined at interpreter exit, so one hung
+    request would hold the process open long after the fetch deadline.
+    Daemon threads are simply dropped when the run ends.
+    """
+    work = queue.SimpleQueue()
+    futures = []
+    for item in items:
+        future = Future()
+        futures.append(future)
+        work.put((future, item))
+
+    def worker():
+        while True:
+            try:
+                future, item = work.get_nowait()
+            except queue.Empty:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(item))
+            except BaseException as e:
+                future.set_exception(e)
+
+    for i in range(min(max(1, workers), len(futures))):
+        threading.Thread(target=worker, name=f"{name}_{i}", daemon=True).start()
+    return futures
+
+def fetch_sources(sources=None, deadline=FETCH_DEADLINE, timeouts=None):
+    """Run every fetcher at the same time and return {name: jobs} for each source.
+
+    Each source gets its own timeout (SOURCE_TIMEOUT unless overridden in
+    `timeouts`) and nobody waits past the global deadline. A source that
+    fails or is still running is reported and mapped to None, so one hung
+    board only costs its own results.
+    """
+    sources = enabled_sources() if sources is None else sources
+    timeouts = timeouts or {}
+    if not sources:
+        return {}
+
+    started = time.monotonic()
+    futures = list(zip(
+        [name for name, _ in sources],
+        daemon_map(lambda fetch: fetch(), [fetch for _, fetch in sources], len(sources), name="fetch"),
+    ))
+
+    outcomes = {}
+    try:
+        # Collect in source order so the output stays stable between runs
+        for name, future in futures:
+            limit = min(timeouts.get(name, SOURCE_TIMEOUT), deadline)
+            remaining = max(0.0, started + limit - time.monotonic())
+            outcomes[name] = None
+            try:
+                outcomes[name] = future.result(timeout=remaining) or []
+            except FutureTimeoutError:
+                print(f"⏱️ {name}: no response after {limit:g}s, skipping")
+                METRICS.inc("source_failures", source=name, reason="timeout")
+                log_event("source_failed", source=name, reason="timeout")
+            except Exception as e:
+                print(f"❌ {name} error: {e}")
+                METRICS.inc("source_failures", source=name, reason="error")
+                log_event("source_failed", source=name, reason="error", error=str(e))
+    finally:
+        # Don't wait on stragglers: they run on daemon threads, so they are
+        # abandoned here and can't keep the process alive at exit either
+        for _, future in futures:
+            future.cancel()
+
+    elapsed = time.monotonic() - started
+    METRICS.observe("stage_seconds", elapsed, stage="fetch")
+    print(f"⏱️ Fetched {len(sources)} sources in {elapsed:.1f}s")
+    return outcomes
+
+def fetch_all(sources=None, deadline=FETCH_DEADLINE, timeouts=None):
+    """Jobs from every source that answered in time, in source order"""
+    outcomes = fetch_sources(sources, deadline, timeouts)
+    return [job for jobs in outcomes.values() if jobs for job in jobs]
 
 # ----------- MAIN PIPELINE -----------
+def notify_new_jobs(jobs, seen):
+    """Dedup `jobs`, send the ones not in `seen`, and return (new_jobs, sent_jobs)"""
+    with METRICS.timer("stage_seconds", stage="dedup"):
+        unique_jobs = dedup_jobs(jobs)
+    print(f"🧹 Unique jobs: {len(unique_jobs)} (duplicates removed: {len(jobs) - len(unique_jobs)})")
+
+    with METRICS.timer("stage_seconds", stage="seen_filter"):
+        new_jobs = seen.filter_new(unique_jobs)
+    METRICS.inc("jobs_new", len(new_jobs))
+    print(f"🆕 New since last run: {len(new_jobs)} (already sent: {len(unique_jobs) - len(new_jobs)})")
+    if not new_jobs:
+        return new_jobs, []
+
+    # Send results (limit to avoid spam); pacing is handled by the dispatcher
+    jobs_to_send = new_jobs[:MAX_JOBS_PER_RUN]
+    with METRICS.timer("stage_seconds", stage="send"):
+        sent_jobs = DISPATCHER.send_jobs(jobs_to_send, digest=TELEGRAM_DIGEST)
+    METRICS.inc("jobs_sent", len(sent_jobs))
+
+    # Only remember what actually went out, so failed sends retry next run
+    seen.add(sent_jobs)
+    return new_jobs, sent_jobs
+
 def run():
+    """One full check; metrics are exported even when it stops early"""
+    try:
+        with METRICS.timer("stage_seconds", stage="run"):
+            run_pipeline()
+    finally:
+        export_metrics()
+
+def run_pipeline():
     start_time = datetime.now()
     today = date.today().strftime("%Y-%m-%d")
     print(f"⏰ Started job check at {start_time}")
@@ -253,15 +1436,8 @@ def run():
     start_msg = f"🤖 Job Bot Started\n📅 Date: {today}\n⏰ Time: {start_time.strftime('%H:%M:%S')}"
     send_telegram(start_msg)
 
-    all_jobs = []
-
     try:
-        all_jobs.extend(fetch_remotive())
-        all_jobs.extend(fetch_remoteok())
-        all_jobs.extend(fetch_wwr())
-        all_jobs.extend(fetch_hackernews())
-        # Indeed is disabled due to high failure rate
-        # all_jobs.extend(fetch_indeed())
+        all_jobs = fetch_all()
     except Exception as e:
         error_msg = f"⚠️ Job bot error: {str(e)}"
         print(error_msg)
@@ -270,35 +1446,142 @@ def run():
 
     print(f"📈 Total today's jobs found: {len(all_jobs)}")
 
-    if not all_jobs:
+    seen = SeenJobs()
+    try:
+        new_jobs, sent_jobs = notify_new_jobs(all_jobs, seen)
+    finally:
+        seen.close()
+
+    if not new_jobs:
         message = f"📭 No new Python/FastAPI jobs found for {today}."
         print(message)
         send_telegram(message)
         return
 
-    # Send results (limit to avoid spam)
-    success_count = 0
-    jobs_to_send = all_jobs[:15]  # Increased limit since we're filtering by date
-    
-    for job in jobs_to_send:
-        msg = (
-            f"💼 <b>{job['title']}</b>\n"
-            f"🏢 {job['company']}\n"
-            f"📅 {job.get('date', 'Today')}\n"
-            f"🔗 {job['url']}\n"
-            f"🌍 Source: {job['source']}"
-        )
-        if send_telegram(msg):
-            success_count += 1
-        time.sleep(1)  # Avoid rate limiting
-
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
     
-    summary = f"✅ Bot completed in {duration:.1f}s\n📅 Date: {today}\n📊 Found: {len(all_jobs)} jobs\n📤 Sent: {success_count} notifications"
+    summary = f"✅ Bot completed in {duration:.1f}s\n📅 Date: {today}\n📊 Found: {len(all_jobs)} jobs\n🆕 New: {len(new_jobs)} jobs\n📤 Sent: {len(sent_jobs)} jobs"
     print(summary)
     send_telegram(summary)
 
+# ----------- DAEMON MODE -----------
+class SourceSchedule:
+    """When to poll one source next, adapting to how often it changes.
+
+    A poll that turns up jobs the previous one did not have halves the
+    interval (down to min_interval); a poll with nothing new grows it by half
+    (up to max_interval). Failures back off exponentially from min_interval,
+    capped at max_interval. Every delay gets +/- POLL_JITTER so sources
+    don't fire in lockstep.
+    """
+
+    def __init__(self, name, fetch, min_interval, max_interval, now):
+        self.name = name
+        self.fetch = fetch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.failures = 0
+        self.last_keys = None
+        self.next_run = now  # first poll right away
+
+    def record_success(self, jobs, now):
+        keys = {job_key(job) for job in jobs}
+        if self.last_keys is not None:
+            if keys - self.last_keys:
+                self.interval = max(self.min_interval, self.interval / 2)
+            else:
+                self.interval = min(self.max_interval, self.interval * 1.5)
+        self.last_keys = keys
+        self.failures = 0
+        self.schedule(now, self.interval)
+
+    def record_failure(self, now):
+        self.failures += 1
+        self.schedule(now, min(self.max_interval, self.min_interval * 2 ** self.failures))
+
+    def schedule(self, now, delay):
+        self.next_run = now + delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+def poll_interval(name):
+    plugin = SOURCE_REGISTRY.get(name)
+    return plugin.poll_interval if plugin else DEFAULT_POLL_INTERVAL
+
+def run_daemon(sources=None, stop_event=None, clock=time.monotonic):
+    """Poll each source on its own adaptive schedule until stopped.
+
+    The HTTP sessions, seen-jobs index and feed cache stay warm between
+    cycles, so a poll only costs the requests themselves. SIGINT/SIGTERM
+    (or setting `stop_event`) ends the loop after the current cycle.
+    """
+    sources = enabled_sources() if sources is None else sources
+    stop_event = stop_event or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop_event.set())
+
+    now = clock()
+    schedules = [
+        SourceSchedule(name, fetch, *poll_interval(name), now)
+        for name, fetch in sources
+    ]
+    if METRICS_PORT:
+        serve_metrics(METRICS_PORT)
+    print(f"🔁 Daemon started with {len(schedules)} sources")
+    send_telegram(f"🤖 Job Bot daemon started\n⏰ Time: {datetime.now().strftime('%H:%M:%S')}")
+
+    seen = SeenJobs()
+    try:
+        while not stop_event.is_set():
+            due = [s for s in schedules if s.next_run <= clock()]
+            if due:
+                outcomes = fetch_sources([(s.name, s.fetch) for s in due])
+                now = clock()
+                jobs = []
+                for s in due:
+                    result = outcomes.get(s.name)
+                    if result is None:
+                        s.record_failure(now)
+                    else:
+                        s.record_success(result, now)
+                        jobs.extend(result)
+                try:
+                    if jobs:
+                        new_jobs, sent_jobs = notify_new_jobs(jobs, seen)
+                        print(f"📤 Cycle done: {len(jobs)} found, {len(new_jobs)} new, {len(sent_jobs)} sent")
+                    # A one-shot run prunes when it opens the store; the daemon keeps it
+                    # open for days, so expired entries are evicted every cycle instead
+                    seen.prune()
+                    export_metrics()
+                except Exception as e:
+                    # One bad cycle (a full disk, a locked store) must not end the daemon
+                    print(f"❌ Daemon cycle failed: {e}")
+                    METRICS.inc("daemon_errors")
+                    log_event("daemon_error", error=str(e))
+
+            upcoming = min(schedules, key=lambda s: s.next_run)
+            wait = max(0.0, upcoming.next_run - clock())
+            print(f"💤 Next poll: {upcoming.name} in {wait:.0f}s")
+            stop_event.wait(wait)
+    finally:
+        seen.close()
+        print("👋 Daemon stopped")
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Find remote Python jobs and send them to Telegram")
+    parser.add_argument("--daemon", action="store_true", help="keep running and poll each source on its own schedule")
+    parser.add_argument("--profile", metavar="PATH", help="run once under cProfile and save the stats to PATH")
+    args = parser.parse_args()
+    if args.daemon and args.profile:
+        parser.error("--profile only works for a single run")
+    if args.daemon:
+        run_daemon()
+    elif args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(run)
+        profiler.dump_stats(args.profile)
+        print(f"🧪 Profile saved to {args.profile}; top functions by cumulative time:")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+    else:
+        run()
\ No newline at end of file
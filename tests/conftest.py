@@ -0,0 +1,57 @@
+import json
+import os
+import sys
+import time
+
+import requests
+
+# main.py is a script at the repo root, not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeResponse:
+    """Enough of requests.Response for main.py; `body` is bytes or anything JSON-serializable"""
+
+    def __init__(self, status_code=200, body=b"", headers=None, reason="", chunk_delay=0.0):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = reason
+        self.headers = headers or {}
+        self.content = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.chunk_delay = chunk_delay  # seconds per chunk, to stand in for a slow network
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            time.sleep(self.chunk_delay)
+            yield self.content[i:i + chunk_size]
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} {self.reason}", response=self)
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Replays `outcomes` (FakeResponses, or exceptions to raise) in order and records each request"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def request(self, method, url, headers=None, data=None, **kwargs):
+        self.requests.append({"method": method, "url": url, "headers": headers or {}, "data": data})
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
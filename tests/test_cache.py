@@ -0,0 +1,56 @@
+import json
+
+import main
+from conftest import FakeResponse, FakeSession
+
+
+def test_304_keeps_the_validators_the_server_sent_last(tmp_path):
+    session = FakeSession([
+        FakeResponse(200, b"[1, 2]", {"ETag": '"v1"'}),
+        FakeResponse(304, headers={"ETag": '"v2"'}),
+        FakeResponse(304),
+    ])
+    url = "https://feed.example/jobs"
+    list(main.cached_get(url, cache_dir=str(tmp_path), session=session).iter_content())
+
+    response = main.cached_get(url, cache_dir=str(tmp_path), session=session)
+    assert response.revalidated and response.json() == [1, 2]
+    main.cached_get(url, cache_dir=str(tmp_path), session=session)
+    assert session.requests[1]["headers"]["If-None-Match"] == '"v1"'
+    assert session.requests[2]["headers"]["If-None-Match"] == '"v2"'
+
+
+def register_feed(monkeypatch, tmp_path, session, parses):
+    monkeypatch.setattr(main, "HTTP_CACHE_DIR", str(tmp_path))
+
+    def iter_feed(parse_date, get):
+        for job in main.iter_json_array(get("https://feed.example/jobs", session=session).iter_content()):
+            parses.append(job)
+            yield main.Job(job["title"], "Acme", job["url"], "Feed"), job["title"]
+
+    monkeypatch.setitem(main.SOURCE_REGISTRY, "Feed",
+                        main.SourcePlugin("Feed", iter_feed, undated_is_recent=True, cached_feed=True))
+
+
+def test_unchanged_feed_is_not_parsed_again(tmp_path, monkeypatch):
+    body = json.dumps([{"title": "Backend Engineer", "url": "https://feed.example/1"}]).encode()
+    session = FakeSession([FakeResponse(200, body, {"ETag": '"v1"'}), FakeResponse(304)])
+    parses = []
+    register_feed(monkeypatch, tmp_path, session, parses)
+    first = main.fetch_source("Feed")
+    second = main.fetch_source("Feed")
+    assert first == second == [main.Job("Backend Engineer", "Acme", "https://feed.example/1", "Feed")]
+    assert len(parses) == 1
+    assert len(session.requests) == 2
+
+
+def test_changed_keywords_reparse_an_unchanged_feed(tmp_path, monkeypatch):
+    body = json.dumps([{"title": "Backend Engineer", "url": "https://feed.example/1"}]).encode()
+    session = FakeSession([FakeResponse(200, body, {"ETag": '"v1"'}), FakeResponse(304)])
+    parses = []
+    register_feed(monkeypatch, tmp_path, session, parses)
+
+    assert len(main.fetch_source("Feed")) == 1
+    monkeypatch.setattr(main, "MATCHER", main.KeywordMatcher(["backend"], exclude=["engineer"]))
+    assert main.fetch_source("Feed") == []
+    assert len(parses) == 2
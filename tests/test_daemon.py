@@ -0,0 +1,83 @@
+import itertools
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import main
+
+
+class DeliverAll:
+    def __init__(self):
+        self.sent = []
+
+    def send_jobs(self, jobs, digest=True):
+        self.sent.extend(jobs)
+        return jobs
+
+
+@pytest.fixture
+def daemon_env(tmp_path, monkeypatch):
+    """Keep run_daemon off the real Telegram chat (main loads .env) and off pytest's signal handlers"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "DISPATCHER", DeliverAll())
+    monkeypatch.setattr(main, "send_telegram", lambda message: True)
+    monkeypatch.setattr(main.signal, "signal", lambda *args: None)
+    monkeypatch.setattr(main, "METRICS_PORT", 0)
+    return main.DISPATCHER
+
+
+def test_daemon_evicts_expired_seen_jobs_every_cycle(daemon_env):
+    stop = threading.Event()
+
+    def source():
+        # Something that expired while the daemon was already running
+        with sqlite3.connect(main.SEEN_DB_PATH) as conn:
+            conn.execute("INSERT INTO seen_jobs (key, url, seen_at) VALUES ('old', 'https://a/1', ?)",
+                         (time.time() - 30 * 86400,))
+        stop.set()
+        return []
+
+    main.run_daemon([("Test", source)], stop_event=stop)
+    with sqlite3.connect(main.SEEN_DB_PATH) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0] == 0
+
+
+def test_copy_on_another_board_in_a_later_cycle_is_not_sent_again(tmp_path, monkeypatch):
+    dispatcher = DeliverAll()
+    monkeypatch.setattr(main, "DISPATCHER", dispatcher)
+    seen = main.SeenJobs(path=str(tmp_path / "seen.db"))
+    remotive = main.Job("Senior Backend Engineer", "Acme Inc", "https://remotive.com/jobs/1", "Remotive")
+    remoteok = main.Job("Senior Backend Engineer", "Acme", "https://remoteok.io/jobs/9", "RemoteOK")
+    wwr = main.Job("Acme: Senior Backend Engineer", "WeWorkRemotely Job", "https://wwr.com/1", "WeWorkRemotely")
+
+    main.notify_new_jobs([remotive], seen)
+    main.notify_new_jobs([remoteok], seen)
+    seen.close()
+    # ...and across runs, from the reopened store
+    seen = main.SeenJobs(path=str(tmp_path / "seen.db"))
+    main.notify_new_jobs([wwr], seen)
+    seen.close()
+    assert dispatcher.sent == [remotive]
+
+
+def test_a_failing_cycle_does_not_stop_the_daemon(daemon_env, monkeypatch):
+    stop = threading.Event()
+    calls = []
+
+    def source():
+        calls.append(1)
+        if len(calls) == 2:
+            stop.set()
+        return [main.Job("Backend Engineer", "Acme", f"https://a/{len(calls)}", "Test")]
+
+    def broken_export():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(main, "export_metrics", broken_export)
+    # Each clock reading is an hour later, so the next poll is always due
+    clock = itertools.count(step=3600).__next__
+    main.run_daemon([("Test", source)], stop_event=stop, clock=clock)
+    assert len(calls) == 2
+    assert [job.url for job in daemon_env.sent] == ["https://a/1"]
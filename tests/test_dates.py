@@ -0,0 +1,7 @@
+import main
+
+
+def test_date_parser_switches_between_every_feed_format():
+    parser = main.DateParser()
+    values = ["Mon, 22 Dec 2025 12:00:00 +0000", 1768294800, "2026-01-13T12:00:00", "Tue, 23 Dec 2025 08:00:00 GMT"]
+    assert all(parser.parse(value) is not None for value in values)
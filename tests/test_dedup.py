@@ -0,0 +1,56 @@
+import random
+
+import main
+from bench import fixtures
+
+
+def job(title, company, url):
+    return main.Job(title=title, company=company, url=url, source="Test")
+
+
+def test_same_title_at_different_companies_is_kept():
+    jobs = [
+        job("Senior Staff Backend Software Engineer", "Acme", "https://a/1"),
+        job("Senior Staff Backend Software Engineer", "Hooli", "https://a/2"),
+        job("Software Engineer, Backend Platform Infrastructure", "Google", "https://a/3"),
+        job("Software Engineer, Backend Platform Infrastructure", "Meta", "https://a/4"),
+    ]
+    assert main.dedup_jobs(jobs) == jobs
+
+
+def test_seniority_and_qualifiers_keep_jobs_apart():
+    jobs = [
+        job("Senior Backend Engineer", "Acme", "https://a/1"),
+        job("Junior Backend Engineer", "Acme", "https://a/2"),
+        job("Senior Engineer (Go)", "Acme", "https://a/3"),
+        job("Senior Engineer (Python)", "Acme", "https://a/4"),
+    ]
+    assert main.dedup_jobs(jobs) == jobs
+
+
+def test_same_job_across_boards_is_merged():
+    jobs = [
+        job("Senior Python Engineer", "Acme Inc", "https://remotive.com/j/1?utm_source=x"),
+        job("Senior Python Engineer (Remote)", "Acme Inc.", "https://remoteok.io/j/9"),
+        job("Acme: Senior Python Engineer", "WeWorkRemotely Job", "https://weworkremotely.com/j/3"),
+        job("Senior Python Engineers", "Acme", "https://example.com/j/4"),
+    ]
+    assert main.dedup_jobs(jobs) == jobs[:1]
+
+
+def test_unknown_company_only_matches_exactly():
+    jobs = [
+        job("Backend Engineer at Z", "Hacker News", "https://news.ycombinator.com/item?id=1"),
+        job("Backend Engineers at Z", "Hacker News", "https://news.ycombinator.com/item?id=2"),
+    ]
+    assert main.dedup_jobs(jobs) == jobs
+
+
+def test_distinct_fixture_jobs_are_all_kept():
+    rng = random.Random(0)
+    jobs = [
+        job(rng.choice(fixtures.TITLES), rng.choice(fixtures.COMPANIES), f"https://x/{i}")
+        for i in range(500)
+    ]
+    distinct = {main.company_and_title(j) for j in jobs}
+    assert len(main.dedup_jobs(jobs)) == len(distinct)
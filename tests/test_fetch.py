@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+import time
+
+import main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_results_keep_source_order_and_failures_map_to_none():
+    def broken():
+        raise RuntimeError("boom")
+
+    outcomes = main.fetch_sources([("a", lambda: [1]), ("b", broken), ("c", lambda: None)])
+    assert outcomes == {"a": [1], "b": None, "c": []}
+
+
+def test_deadline_ends_the_process_not_just_the_fetch():
+    script = (
+        "import time, main\n"
+        "main.fetch_all([('slow', lambda: time.sleep(8))], timeouts={'slow': 1})\n"
+    )
+    started = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True,
+                   env={**os.environ, "METRICS_LOG": "", "METRICS_FILE": ""})
+    assert time.monotonic() - started < 5
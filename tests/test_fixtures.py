@@ -0,0 +1,12 @@
+import json
+
+from bench import fixtures
+
+
+def test_payloads_do_not_depend_on_the_wall_clock():
+    routes = fixtures.build(1)
+    assert routes == fixtures.build(1)
+    metadata = json.loads(routes["/api"])[0]
+    assert metadata["last_updated"] == int(fixtures.REFERENCE_TIME.timestamp())
+    assert max(job["publication_date"] for job in json.loads(routes["/api/remote-jobs"])["jobs"]) \
+        <= fixtures.REFERENCE_TIME.strftime("%Y-%m-%dT%H:%M:%S")
@@ -0,0 +1,21 @@
+import main
+
+
+def test_overlapping_keywords_each_count():
+    matcher = main.KeywordMatcher(["backend", "backend engineer"], min_score=2)
+    assert matcher.score("Senior Backend Engineer") == 2
+    assert matcher.matches("Senior Backend Engineer")
+    assert not matcher.matches("Backend developer")
+
+
+def test_exclude_terms_and_weights():
+    matcher = main.KeywordMatcher(["python", "django"], exclude=["senior"], weights={"django": 2}, min_score=3)
+    assert matcher.matches("Python / Django developer")
+    assert not matcher.matches("Django developer")
+    assert not matcher.matches("Senior Python / Django developer")
+
+
+def test_partially_overlapping_keywords_each_count():
+    matcher = main.KeywordMatcher(["backend engineer", "engineer manager", "c++"], min_score=3)
+    assert matcher.score("Backend Engineer Manager, C++") == 3
+    assert matcher.score("backend engineering manager") == 0
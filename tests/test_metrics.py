@@ -0,0 +1,36 @@
+import requests
+
+import main
+from conftest import FakeResponse, FakeSession
+
+
+def test_metrics_endpoint_binds_to_localhost_by_default():
+    main.METRICS.inc("test_events", source="Test")
+    server = main.serve_metrics(port=0)
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+        body = requests.get(f"http://127.0.0.1:{server.server_port}/metrics", timeout=5).text
+        assert 'jobbot_test_events_total{source="Test"} 1' in body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_download_time_is_kept_out_of_parse_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "HTTP_CACHE_DIR", str(tmp_path))
+    body = b"[" + b",".join(b'{"title": "Backend Engineer"}' for _ in range(20)) + b"]"
+    # 20 chunks of 0.02s each: about 0.4s on the wire, almost nothing to parse
+    session = FakeSession([FakeResponse(200, body, chunk_delay=0.02)])
+
+    def iter_slow(parse_date):
+        response = main.cached_get("https://slow.example/jobs", session=session)
+        for job in main.iter_json_array(response.iter_content(len(body) // 20 + 1)):
+            yield main.Job(job["title"], "Acme", "https://slow.example/1", "Slow"), job["title"]
+
+    monkeypatch.setitem(main.SOURCE_REGISTRY, "Slow", main.SourcePlugin("Slow", iter_slow, undated_is_recent=True))
+    main.fetch_source("Slow")
+    labels = (("source", "Slow"),)
+    download = main.METRICS.summaries[("download_seconds", labels)][1]
+    parse = main.METRICS.summaries[("parse_seconds", labels)][1]
+    assert download >= 0.3
+    assert parse < 0.1
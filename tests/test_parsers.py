@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+import main
+
+
+def one_byte_chunks(payload):
+    return (payload[i:i + 1] for i in range(len(payload)))
+
+
+def test_scalar_split_across_chunks_stays_whole():
+    assert list(main.iter_json_array([b"[12", b"34, 5]"])) == [1234, 5]
+    assert list(main.iter_json_array([b"[tr", b"ue, 1.", b"5e3]"])) == [True, 1500.0]
+
+
+def test_every_split_point_gives_the_same_elements():
+    items = [{"title": "Ingénieur backend ✓", "tags": ["python", "go"]}, 42, "naïve", None, -0.5]
+    payload = json.dumps(items, ensure_ascii=False).encode("utf-8")
+    assert list(main.iter_json_array(one_byte_chunks(payload))) == items
+    for cut in range(1, len(payload)):
+        assert list(main.iter_json_array([payload[:cut], payload[cut:]])) == items
+
+
+def test_array_under_a_key():
+    payload = json.dumps({"0-legal-notice": "x", "jobs": [{"id": 1}, {"id": 2}], "after": [9]}).encode()
+    assert list(main.iter_json_array(one_byte_chunks(payload), key="jobs")) == [{"id": 1}, {"id": 2}]
+    with pytest.raises(ValueError):
+        list(main.iter_json_array([payload], key="missing"))
+
+
+def test_truncated_array_raises():
+    with pytest.raises(ValueError):
+        list(main.iter_json_array([b'[{"id": 1}, {"id"']))
+
+
+def test_xml_items_stream_and_are_cleared():
+    payload = (
+        '<?xml version="1.0" encoding="UTF-8"?><rss><channel><title>Feed</title>'
+        "<item><title>Acme: Backend Engineer</title><link>https://a/1</link></item>"
+        "<item><title>Café: Go Developer</title><link>https://a/2</link></item>"
+        "</channel></rss>"
+    ).encode("utf-8")
+    seen = []
+    items = []
+    for item in main.iter_xml_items(one_byte_chunks(payload)):
+        seen.append((item.findtext("title"), item.findtext("link")))
+        items.append(item)
+    assert seen == [("Acme: Backend Engineer", "https://a/1"), ("Café: Go Developer", "https://a/2")]
+    assert all(len(item) == 0 for item in items)
@@ -0,0 +1,55 @@
+import itertools
+
+import main
+
+
+def job(n, company="Acme"):
+    return main.Job(f"Engineer {n}", company, f"https://jobs.example/{n}", "Test")
+
+
+def test_size_bound_keeps_the_newest_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(main.time, "time", itertools.count(1_000_000).__next__)
+    seen = main.SeenJobs(path=str(tmp_path / "seen.db"), max_entries=3)
+    for n in range(5):
+        seen.add([job(n)])
+    assert len(seen) == 3
+    assert [job(n) in seen for n in range(5)] == [False, False, True, True, True]
+    seen.close()
+
+
+def test_expired_rows_are_evicted_on_open(tmp_path, monkeypatch):
+    path = str(tmp_path / "seen.db")
+    seen = main.SeenJobs(path=path, ttl_days=7)
+    seen.add([job(1)])
+    seen.close()
+
+    now = main.time.time()
+    monkeypatch.setattr(main.time, "time", lambda: now + 8 * 86400)
+    seen = main.SeenJobs(path=path, ttl_days=7)
+    assert len(seen) == 0 and job(1) not in seen
+    assert seen.conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0] == 0
+    seen.close()
+
+
+def test_filter_new_drops_seen_jobs_and_repeats_within_the_batch(tmp_path):
+    seen = main.SeenJobs(path=str(tmp_path / "seen.db"))
+    seen.add([job(1)])
+    repeat = main.Job("Engineer 2", "Acme", "https://jobs.example/2?utm=x#top", "Other")
+    assert seen.filter_new([job(1), job(2), repeat, job(3)]) == [job(2), job(3)]
+    seen.close()
+
+
+class DeliverFirst:
+    def send_jobs(self, jobs, digest=True):
+        return jobs[:1]
+
+
+def test_only_delivered_jobs_are_stored(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "DISPATCHER", DeliverFirst())
+    seen = main.SeenJobs(path=str(tmp_path / "seen.db"))
+    new_jobs, sent_jobs = main.notify_new_jobs([job(1, "Acme"), job(2, "Hooli")], seen)
+    assert sent_jobs == [job(1, "Acme")]
+    assert job(1, "Acme") in seen and job(2, "Hooli") not in seen
+    # The undelivered one is offered again next run
+    assert seen.filter_new(new_jobs) == [job(2, "Hooli")]
+    seen.close()
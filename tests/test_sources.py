@@ -0,0 +1,44 @@
+import json
+from datetime import date
+
+import main
+
+
+def test_enabled_sources_follow_the_env_list_and_skip_unknown_names(monkeypatch, capsys):
+    monkeypatch.setattr(main, "ENABLED_SOURCES", ["Hacker News", "Nope", "Remotive"])
+    assert [name for name, _ in main.enabled_sources()] == ["Hacker News", "Remotive"]
+    assert "Unknown sources in ENABLED_SOURCES: Nope" in capsys.readouterr().out
+
+
+def test_without_the_env_list_every_enabled_plugin_runs(monkeypatch):
+    monkeypatch.setattr(main, "ENABLED_SOURCES", [])
+    monkeypatch.setitem(main.SOURCE_REGISTRY, "Off", main.SourcePlugin("Off", lambda parse_date: iter(()), enabled=False))
+    names = [name for name, _ in main.enabled_sources()]
+    assert "Off" not in names
+    assert names == [name for name, plugin in main.SOURCE_REGISTRY.items() if plugin.enabled]
+
+
+def test_jobs_round_trip_through_the_saved_feed(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "HTTP_CACHE_DIR", str(tmp_path))
+    jobs = [
+        main.Job("Backend Engineer", "Acme", "https://a/1", "Remotive", date(2026, 1, 14)),
+        main.Job("Python Developer", "WeWorkRemotely Job", "https://a/2", "WeWorkRemotely"),
+    ]
+    main.save_parsed_feed("Remotive", [(1, 2)], jobs)
+    assert main.load_parsed_feed("Remotive") == ([(1, 2)], jobs)
+    assert main.load_parsed_feed("RemoteOK") is None
+
+
+def test_remoteok_links_are_made_absolute():
+    payload = json.dumps([
+        {"legal": "API Terms of Service"},
+        {"position": "Backend Engineer", "company": "Acme", "url": "/remote-jobs/1", "epoch": 1768294800},
+        {"position": "Go Developer", "company": "Hooli", "url": "https://remoteok.com/remote-jobs/2"},
+    ]).encode()
+
+    def get(url, **kwargs):
+        return main.CachedResponse(url, content=payload)
+
+    jobs = [job for job, _ in main.iter_remoteok(main.DateParser().parse, get=get)]
+    assert [job.url for job in jobs] == ["https://remoteok.io/remote-jobs/1", "https://remoteok.com/remote-jobs/2"]
+    assert jobs[0].posted is not None and jobs[1].posted is None
@@ -0,0 +1,58 @@
+import re
+
+import requests
+
+import main
+from conftest import FakeResponse, FakeSession
+
+TOKEN = "123456:SECRET-bot-token"
+
+
+def dispatcher(outcomes):
+    return main.TelegramDispatcher(
+        token=TOKEN, chat_id="42", session=FakeSession(outcomes), rate=1000, burst=1,
+        max_retries=1, sleep=lambda s: None,
+    )
+
+
+def test_errors_never_log_the_token(tmp_path, monkeypatch, capsys):
+    log = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(main, "METRICS_LOG", str(log))
+    url = f"https://api.telegram.org/bot{TOKEN}/sendMessage"
+
+    bad_request = FakeResponse(400, {"ok": False, "description": "Bad Request: chat not found"}, reason="Bad Request")
+    assert not dispatcher([bad_request]).send("hi")
+    network = requests.ConnectionError(f"Max retries exceeded with url: {url}")
+    assert not dispatcher([network, network]).send("hi")
+
+    logged = log.read_text()
+    printed = capsys.readouterr().out
+    assert "400 Bad Request: chat not found" in logged
+    assert TOKEN not in logged
+    assert TOKEN not in printed
+
+
+def test_group_chats_are_capped_per_minute():
+    def sleeps_for_three_sends(per_minute):
+        sleeps = []
+        sent = FakeResponse(200, {"ok": True})
+        dispatcher = main.TelegramDispatcher(
+            token=TOKEN, chat_id="-100", session=FakeSession([sent] * 3), per_minute=per_minute,
+            sleep=sleeps.append,
+        )
+        assert all(dispatcher.send("hi") for _ in range(3))
+        return sum(sleeps)
+
+    # One message per second by default, no burst
+    assert 1.9 < sleeps_for_three_sends(per_minute=0) < 2.1
+    # 20/minute spaces them at least three seconds apart
+    assert sleeps_for_three_sends(per_minute=20) >= 6
+
+
+def test_long_entries_are_shortened_without_cutting_html():
+    job = main.Job("R&D " * 2000, "Acme & <Sons>" * 300, "https://a/1?x=1&y=2", "Test")
+    (text, batch), = main.pack_digests([job], limit=500)
+    assert len(text) <= 500 and batch == [job]
+    assert text.count("<b>") == text.count("</b>") == 1
+    assert re.fullmatch(r"([^&]|&(amp|lt|gt|quot|#x27);)*", text, re.S)
+    assert "https://a/1?x=1&amp;y=2" in text